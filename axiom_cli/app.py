@@ -12,12 +12,11 @@ from __future__ import annotations
 
 import csv
 import json
-import uuid
+import secrets
 from pathlib import Path
 from typing import Any
 
 import typer
-import yaml
 
 from axiom_tfg.models import TaskSpec
 from axiom_tfg.runner import (
@@ -27,6 +26,7 @@ from axiom_tfg.runner import (
     run_taskspec,
     write_artifact_bundle,
 )
+from axiom_tfg.utils import load_yaml
 from axiom_server.sweep import (
     RangeSpec,
     SweepRequest,
@@ -96,7 +96,7 @@ def run(
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=1)
 
-    run_id = uuid.uuid4().hex[:12]
+    run_id = secrets.token_hex(6)
     if out is None:
         out = Path("artifacts") / f"run_{run_id}"
 
@@ -134,27 +134,26 @@ def sweep(
     junit: bool = typer.Option(True, "--junit/--no-junit", help="Write junit.xml."),
 ) -> None:
     """Run a deterministic parameter sweep and write sweep artifacts."""
+    # Build variation spec from CLI flags.
+    mass_range = None
+    if mass_min is not None and mass_max is not None:
+        mass_range = RangeSpec(min=mass_min, max=mass_max)
+
     try:
         with open(base_yaml, "r", encoding="utf-8") as fh:
-            raw = yaml.safe_load(fh)
+            raw = load_yaml(fh)
         base_task = TaskSpec.model_validate(raw)
+        variations = VariationSpec(mass_kg=mass_range)
+        sweep_req = SweepRequest(base_task=base_task, variations=variations, n=n, seed=seed)
+        variants = generate_variants(base_task, sweep_req)
     except Exception as exc:
         typer.echo(f"ERROR: {exc}", err=True)
         raise typer.Exit(code=1)
 
-    sweep_id = uuid.uuid4().hex[:12]
+    sweep_id = secrets.token_hex(6)
     if out is None:
         out = Path("artifacts") / "sweeps" / sweep_id
 
-    # Build variation spec from CLI flags.
-    mass_range = None
-    if mass_min is not None and mass_max is not None:
-        mass_range = RangeSpec(min=mass_min, max=mass_max)
-
-    variations = VariationSpec(mass_kg=mass_range)
-    sweep_req = SweepRequest(base_task=base_task, variations=variations, n=n, seed=seed)
-    variants = generate_variants(base_task, sweep_req)
-
     all_results: list[dict[str, Any]] = []
     csv_rows: list[dict[str, Any]] = []
     any_cant = False
@@ -237,7 +236,7 @@ def replay(
         typer.echo("ERROR: no artifact bundles found", err=True)
         raise typer.Exit(code=1)
 
-    replay_id = uuid.uuid4().hex[:12]
+    replay_id = secrets.token_hex(6)
     if out is None:
         out = Path("artifacts") / f"replay_{replay_id}"
 
@@ -300,7 +299,7 @@ def _replay_one(bundle_dir: Path) -> dict[str, Any]:
 
     # Rerun pipeline.
     with open(input_yaml, "r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh)
+        raw = load_yaml(fh)
     spec = TaskSpec.model_validate(raw)
     result, _packet = run_taskspec(spec)
 
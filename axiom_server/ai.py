@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-import os
+import random
 import re
+import time
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
+import orjson
 from fastapi import HTTPException
 
 from axiom_tfg.robots import ROBOT_REGISTRY
 
+from axiom_server import envs
+
 # ── Configuration (env vars) ────────────────────────────────────────────
 
 _DEFAULT_GEMINI_MODELS = [
@@ -28,47 +37,47 @@ _DEFAULT_OPENAI_MODELS = [
 ]
 
 
+# Env var holding the API key for each provider.
+_API_KEY_VARS: dict[str, str] = {
+    "gemini": "GOOGLE_API_KEY",
+    "openai": "AXIOM_OPENAI_API_KEY",
+}
+
+
 def _cfg_provider() -> str:
-    return os.environ.get("AXIOM_AI_PROVIDER", "gemini").lower()
+    return envs.AXIOM_AI_PROVIDER
 
 
 def _cfg_default_model() -> str:
-    provider = _cfg_provider()
-    if provider == "openai":
-        return os.environ.get("AXIOM_OPENAI_MODEL_DEFAULT", "llama-3.3-70b-versatile")
-    return os.environ.get("AXIOM_GEMINI_MODEL_DEFAULT", "gemini-2.0-flash")
+    if _cfg_provider() == "openai":
+        return envs.AXIOM_OPENAI_MODEL_DEFAULT
+    return envs.AXIOM_GEMINI_MODEL_DEFAULT
 
 
 def _cfg_models_allowlist() -> list[str]:
-    provider = _cfg_provider()
-    if provider == "openai":
-        raw = os.environ.get("AXIOM_OPENAI_MODELS_ALLOWLIST", "")
-        if raw.strip():
-            return [m.strip() for m in raw.split(",") if m.strip()]
-        return list(_DEFAULT_OPENAI_MODELS)
-    raw = os.environ.get("AXIOM_GEMINI_MODELS_ALLOWLIST", "")
-    if raw.strip():
-        return [m.strip() for m in raw.split(",") if m.strip()]
-    return list(_DEFAULT_GEMINI_MODELS)
+    if _cfg_provider() == "openai":
+        return list(envs.AXIOM_OPENAI_MODELS_ALLOWLIST or _DEFAULT_OPENAI_MODELS)
+    return list(envs.AXIOM_GEMINI_MODELS_ALLOWLIST or _DEFAULT_GEMINI_MODELS)
 
 
 def _cfg_demo_fallback() -> bool:
-    return os.environ.get("AXIOM_AI_DEMO_FALLBACK", "false").lower() in ("true", "1", "yes")
+    return envs.AXIOM_AI_DEMO_FALLBACK
 
 
 def _cfg_openai_base_url() -> str:
-    return os.environ.get("AXIOM_OPENAI_BASE_URL", "https://api.groq.com/openai/v1")
+    return envs.AXIOM_OPENAI_BASE_URL
 
 
 def _cfg_openai_api_key() -> str:
-    return os.environ.get("AXIOM_OPENAI_API_KEY", "")
+    return envs.AXIOM_OPENAI_API_KEY
 
 
 # ── Public config queries ───────────────────────────────────────────────
 
 
 def get_provider() -> str:
-    return _cfg_provider()
+    """The configured provider, as of the cached availability snapshot."""
+    return _availability()[0]
 
 
 def get_default_model() -> str:
@@ -85,27 +94,31 @@ def is_demo_fallback_enabled() -> bool:
 
 def _has_api_key() -> bool:
     """Return True if the configured provider has its API key set."""
-    provider = _cfg_provider()
-    if provider == "gemini":
-        return bool(os.environ.get("GOOGLE_API_KEY"))
-    if provider == "openai":
-        return bool(_cfg_openai_api_key())
-    return False
+    key_var = _API_KEY_VARS.get(_cfg_provider())
+    return bool(key_var and getattr(envs, key_var))
+
+
+# Availability only changes when the process env does, so it is read once
+# every few seconds instead of on every page load and /ai/status poll.  The
+# endpoint gate and generate/explain all use this one snapshot, so they can
+# never disagree about whether a key is set.
+_STATUS_TTL_S = 5.0
+_status_cache: tuple[float, tuple[str, bool, bool], dict[str, Any]] | None = None
+
+
+def clear_status_cache() -> None:
+    """Force the next status query to re-read the environment."""
+    global _status_cache
+    _status_cache = None
 
 
 def is_available() -> bool:
     """Return True if AI generation can proceed (provider key set OR fallback enabled)."""
-    if _cfg_provider() in ("gemini", "openai") and _has_api_key():
-        return True
-    return _cfg_demo_fallback()
+    return _cached_status()["ai_enabled"]
 
 
-def get_status() -> dict[str, Any]:
-    """Return full AI status dict for /ai/status."""
-    provider = _cfg_provider()
-    has_key = _has_api_key()
-    fallback = _cfg_demo_fallback()
-    enabled = is_available()
+def _compute_status(provider: str, has_key: bool, fallback: bool) -> dict[str, Any]:
+    enabled = has_key or fallback
 
     active_provider: str
     if provider in ("gemini", "openai") and has_key:
@@ -133,6 +146,30 @@ def get_status() -> dict[str, Any]:
     return result
 
 
+def _refresh_status() -> tuple[float, tuple[str, bool, bool], dict[str, Any]]:
+    global _status_cache
+    now = time.monotonic()
+    if _status_cache is None or now - _status_cache[0] >= _STATUS_TTL_S:
+        availability = (_cfg_provider(), _has_api_key(), _cfg_demo_fallback())
+        _status_cache = (now, availability, _compute_status(*availability))
+    return _status_cache
+
+
+def _availability() -> tuple[str, bool, bool]:
+    """Return the cached ``(provider, has_key, demo_fallback)`` snapshot."""
+    return _refresh_status()[1]
+
+
+def _cached_status() -> dict[str, Any]:
+    """Return the shared cached status dict; callers must not mutate it."""
+    return _refresh_status()[2]
+
+
+def get_status() -> dict[str, Any]:
+    """Return full AI status dict for /ai/status (cached for a few seconds)."""
+    return dict(_cached_status())
+
+
 # ── Prompt templates ────────────────────────────────────────────────────
 
 TASKSPEC_SCHEMA_EXAMPLE = """\
@@ -209,72 +246,101 @@ Keep it concise and actionable. Do not use markdown. One sentence only.
 # ── Exception mapping ───────────────────────────────────────────────────
 
 
-def _map_upstream_exception(exc: Exception) -> HTTPException:
-    """Map provider exceptions to HTTPException with JSON detail."""
-    exc_type = type(exc).__name__
-
+# Provider exception class name -> (HTTP status, detail).
+_UPSTREAM_ERRORS: dict[str, tuple[int, str]] = {
     # google.api_core.exceptions
-    if "ResourceExhausted" in exc_type:
-        return HTTPException(status_code=429, detail="AI quota exceeded")
-    if "PermissionDenied" in exc_type:
-        return HTTPException(status_code=403, detail="AI auth error")
-    if "Unauthenticated" in exc_type:
-        return HTTPException(status_code=401, detail="AI auth error")
-    if "InvalidArgument" in exc_type:
-        return HTTPException(status_code=400, detail="AI bad request")
-
+    "ResourceExhausted": (429, "AI quota exceeded"),
+    "PermissionDenied": (403, "AI auth error"),
+    "Unauthenticated": (401, "AI auth error"),
+    "InvalidArgument": (400, "AI bad request"),
     # openai SDK exceptions
-    if "RateLimitError" in exc_type:
-        return HTTPException(status_code=429, detail="AI quota exceeded")
-    if "AuthenticationError" in exc_type:
-        return HTTPException(status_code=401, detail="AI auth error")
-    if "PermissionDeniedError" in exc_type:
-        return HTTPException(status_code=403, detail="AI auth error")
-    if "BadRequestError" in exc_type:
-        return HTTPException(status_code=400, detail="AI bad request")
+    "RateLimitError": (429, "AI quota exceeded"),
+    "AuthenticationError": (401, "AI auth error"),
+    "PermissionDeniedError": (403, "AI auth error"),
+    "BadRequestError": (400, "AI bad request"),
+}
+
 
+def _map_upstream_exception(exc: Exception) -> HTTPException:
+    """Map provider exceptions to HTTPException with JSON detail."""
+    # Walk the MRO so SDK subclasses of a known error map the same way.
+    for cls in type(exc).__mro__:
+        mapped = _UPSTREAM_ERRORS.get(cls.__name__)
+        if mapped is not None:
+            return HTTPException(status_code=mapped[0], detail=mapped[1])
     return HTTPException(status_code=502, detail="AI upstream error")
 
 
 # ── Gemini backend ──────────────────────────────────────────────────────
 
 
-def _get_model(model_name: str | None = None) -> "google.generativeai.GenerativeModel":
-    """Lazily import and configure the Gemini model."""
+_gemini_configured_key: str | None = None
+
+
+def _configure_gemini() -> None:
+    """Point the Gemini SDK at the current API key (no-op when unchanged)."""
+    global _gemini_configured_key
+    key = envs.GOOGLE_API_KEY
+    if key == _gemini_configured_key:
+        return
     import google.generativeai as genai
 
-    genai.configure(api_key=os.environ["GOOGLE_API_KEY"])
-    name = model_name or _cfg_default_model()
-    return genai.GenerativeModel(name)
+    genai.configure(api_key=key)
+    _gemini_configured_key = key
+    # Models bind their client on first use; drop ones tied to the old key.
+    _build_gemini_model.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _build_gemini_model(
+    name: str, system_instruction: str | None
+) -> "google.generativeai.GenerativeModel":
+    import google.generativeai as genai
+
+    return genai.GenerativeModel(name, system_instruction=system_instruction)
+
+
+def _get_model(
+    model_name: str | None = None, system_instruction: str | None = None
+) -> "google.generativeai.GenerativeModel":
+    """Return the cached Gemini model for *model_name* (configuring the SDK once).
+
+    The system prompt is bound to the model rather than prepended to each
+    user turn, so every request shares an identical prefix that the
+    provider's implicit prompt cache can reuse.
+    """
+    _configure_gemini()
+    return _build_gemini_model(model_name or _cfg_default_model(), system_instruction)
+
+
+# Opening fence line, body, then an optional closing fence (models sometimes
+# truncate before emitting it).
+_FENCE_RE = re.compile(r"\A\s*```[^\n]*\n?(.*?)(?:\n\s*```[^\n]*|```[^\n]*)?\s*\Z", re.DOTALL)
 
 
 def _strip_fences(text: str) -> str:
     """Remove markdown code fences if present."""
-    text = text.strip()
-    if text.startswith("```"):
-        lines = text.splitlines()
-        lines = [ln for ln in lines if not ln.startswith("```")]
-        text = "\n".join(lines).strip()
-    return text
+    m = _FENCE_RE.match(text)
+    return m.group(1).strip() if m else text.strip()
 
 
-def _gemini_generate(prompt: str, model_name: str | None = None) -> tuple[str, str]:
+async def _gemini_generate(prompt: str, model_name: str | None = None) -> tuple[str, str]:
     """Call Gemini to generate YAML. Returns (yaml_text, model_used)."""
     name = model_name or _cfg_default_model()
-    model = _get_model(name)
-    response = model.generate_content(
-        [{"role": "user", "parts": [_GENERATE_SYSTEM + "\n\nUser request: " + prompt]}],
+    model = _get_model(name, _GENERATE_SYSTEM)
+    response = await model.generate_content_async(
+        [{"role": "user", "parts": ["User request: " + prompt]}],
     )
     return _strip_fences(response.text), name
 
 
-def _gemini_explain(evidence: dict, model_name: str | None = None) -> tuple[str, str]:
+async def _gemini_explain(evidence: dict, model_name: str | None = None) -> tuple[str, str]:
     """Call Gemini to explain evidence. Returns (explanation, model_used)."""
     name = model_name or _cfg_default_model()
-    model = _get_model(name)
-    evidence_json = json.dumps(evidence, indent=2)
-    response = model.generate_content(
-        [{"role": "user", "parts": [_EXPLAIN_SYSTEM + "\n\nEvidencePacket:\n" + evidence_json]}],
+    model = _get_model(name, _EXPLAIN_SYSTEM)
+    evidence_json = orjson.dumps(evidence, option=orjson.OPT_INDENT_2).decode()
+    response = await model.generate_content_async(
+        [{"role": "user", "parts": ["EvidencePacket:\n" + evidence_json]}],
     )
     return response.text.strip(), name
 
@@ -282,21 +348,49 @@ def _gemini_explain(evidence: dict, model_name: str | None = None) -> tuple[str,
 # ── OpenAI-compatible backend (Groq, Together, OpenRouter, etc.) ────────
 
 
-def _get_openai_client() -> "openai.OpenAI":
-    """Create an OpenAI client pointed at the configured base URL."""
-    from openai import OpenAI
+_http_client: "httpx.AsyncClient | None" = None
 
-    return OpenAI(
-        api_key=_cfg_openai_api_key(),
-        base_url=_cfg_openai_base_url(),
-    )
 
+def _get_http_client() -> "httpx.AsyncClient":
+    """Return the process-wide HTTP client shared by all upstream calls."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        import httpx
 
-def _openai_generate(prompt: str, model_name: str | None = None) -> tuple[str, str]:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+            timeout=30.0,
+        )
+    return _http_client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client.  Called from the app's shutdown hook."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+    _build_openai_client.cache_clear()
+
+
+@lru_cache(maxsize=4)
+def _build_openai_client(api_key: str, base_url: str) -> "openai.AsyncOpenAI":
+    """Build one AsyncOpenAI client per (key, base URL) on the shared HTTP pool."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=_get_http_client())
+
+
+def _get_openai_client() -> "openai.AsyncOpenAI":
+    """Return the shared AsyncOpenAI client for the configured base URL."""
+    return _build_openai_client(_cfg_openai_api_key(), _cfg_openai_base_url())
+
+
+async def _openai_generate(prompt: str, model_name: str | None = None) -> tuple[str, str]:
     """Call an OpenAI-compatible API to generate YAML. Returns (yaml_text, model_used)."""
     name = model_name or _cfg_default_model()
     client = _get_openai_client()
-    response = client.chat.completions.create(
+    response = await client.chat.completions.create(
         model=name,
         messages=[
             {"role": "system", "content": _GENERATE_SYSTEM},
@@ -308,12 +402,12 @@ def _openai_generate(prompt: str, model_name: str | None = None) -> tuple[str, s
     return _strip_fences(text), name
 
 
-def _openai_explain(evidence: dict, model_name: str | None = None) -> tuple[str, str]:
+async def _openai_explain(evidence: dict, model_name: str | None = None) -> tuple[str, str]:
     """Call an OpenAI-compatible API to explain evidence. Returns (explanation, model_used)."""
     name = model_name or _cfg_default_model()
     client = _get_openai_client()
-    evidence_json = json.dumps(evidence, indent=2)
-    response = client.chat.completions.create(
+    evidence_json = orjson.dumps(evidence, option=orjson.OPT_INDENT_2).decode()
+    response = await client.chat.completions.create(
         model=name,
         messages=[
             {"role": "system", "content": _EXPLAIN_SYSTEM},
@@ -332,34 +426,25 @@ _ROBOT_DB: dict[str, dict] = {
     for name, p in ROBOT_REGISTRY.items()
 }
 
+_MASS_RE = re.compile(r"(\d+\.?\d*)\s*kg")
+_XYZ_RE = re.compile(r"\[\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\]")
 
-def _fallback_generate(prompt: str) -> str:
-    """Parse simple patterns from the prompt and emit valid TaskSpec YAML."""
-    lower = prompt.lower()
-
-    mass_match = re.search(r"(\d+\.?\d*)\s*kg", lower)
-    mass = float(mass_match.group(1)) if mass_match else 0.35
-
-    xyz_pattern = r"\[\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*,\s*(-?\d+\.?\d*)\s*\]"
-    xyz_matches = re.findall(xyz_pattern, prompt)
-    initial_xyz = [float(x) for x in xyz_matches[0]] if len(xyz_matches) >= 1 else [1.0, 0.0, 0.8]
-    target_xyz = [float(x) for x in xyz_matches[1]] if len(xyz_matches) >= 2 else [1.2, 0.3, 0.8]
-
-    robot = "ur5e"
-    for name in _ROBOT_DB:
-        if name in lower:
-            robot = name
-            break
+_SUBSTRATE_WORDS = ("box", "can", "bottle", "part", "soda_can", "pallet", "widget", "cup")
 
-    specs = _ROBOT_DB.get(robot, _ROBOT_DB["ur5e"])
+# One alternation over every robot + substrate keyword.  The lookahead makes
+# matches zero-width so overlapping hits (``can`` inside ``soda_can``) are
+# still reported, matching plain ``word in text`` semantics in a single scan.
+_KEYWORDS_RE = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(w)
+        for w in sorted({*_ROBOT_DB, *_SUBSTRATE_WORDS}, key=len, reverse=True)
+    )
+    + "))"
+)
 
-    sub_id = "object"
-    for word in ["box", "can", "bottle", "part", "soda_can", "pallet", "widget", "cup"]:
-        if word in lower:
-            sub_id = word
-            break
 
-    return f"""\
+_FALLBACK_TEMPLATE = """\
 task_id: generated-fallback
 meta:
   template: pick_and_place
@@ -368,19 +453,19 @@ substrate:
   id: {sub_id}
   mass_kg: {mass}
   initial_pose:
-    xyz: [{initial_xyz[0]}, {initial_xyz[1]}, {initial_xyz[2]}]
+    xyz: [{ix}, {iy}, {iz}]
 
 transformation:
   target_pose:
-    xyz: [{target_xyz[0]}, {target_xyz[1]}, {target_xyz[2]}]
+    xyz: [{tx}, {ty}, {tz}]
   tolerance_m: 0.01
 
 constructor:
   id: {robot}
   base_pose:
     xyz: [0.0, 0.0, 0.0]
-  max_reach_m: {specs['max_reach_m']}
-  max_payload_kg: {specs['max_payload_kg']}
+  max_reach_m: {max_reach_m}
+  max_payload_kg: {max_payload_kg}
 
 allowed_adjustments:
   can_move_target: true
@@ -389,6 +474,35 @@ allowed_adjustments:
   can_split_payload: false"""
 
 
+def _fallback_generate(prompt: str) -> str:
+    """Parse simple patterns from the prompt and emit valid TaskSpec YAML."""
+    lower = prompt.lower()
+
+    mass_match = _MASS_RE.search(lower)
+    mass = float(mass_match.group(1)) if mass_match else 0.35
+
+    xyz_matches = _XYZ_RE.findall(prompt)
+    initial_xyz = [float(x) for x in xyz_matches[0]] if len(xyz_matches) >= 1 else [1.0, 0.0, 0.8]
+    target_xyz = [float(x) for x in xyz_matches[1]] if len(xyz_matches) >= 2 else [1.2, 0.3, 0.8]
+
+    found = {m.group(1) for m in _KEYWORDS_RE.finditer(lower)}
+    robot = next((name for name in _ROBOT_DB if name in found), "ur5e")
+    specs = _ROBOT_DB.get(robot, _ROBOT_DB["ur5e"])
+    sub_id = next((w for w in _SUBSTRATE_WORDS if w in found), "object")
+
+    ix, iy, iz = initial_xyz
+    tx, ty, tz = target_xyz
+    return _FALLBACK_TEMPLATE.format_map({
+        "sub_id": sub_id,
+        "mass": mass,
+        "ix": ix, "iy": iy, "iz": iz,
+        "tx": tx, "ty": ty, "tz": tz,
+        "robot": robot,
+        "max_reach_m": specs["max_reach_m"],
+        "max_payload_kg": specs["max_payload_kg"],
+    })
+
+
 def _fallback_explain(evidence: dict) -> str:
     """Deterministically summarize the EvidencePacket in one sentence."""
     verdict = evidence.get("verdict", "UNKNOWN")
@@ -411,6 +525,126 @@ def _fallback_explain(evidence: dict) -> str:
     return f"Task failed at the {gate} gate ({reason}); no automatic fix available."
 
 
+# ── Response cache ──────────────────────────────────────────────────────
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire *ttl* seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, tuple[float, dict[str, str]]] = OrderedDict()
+
+    def get(self, key: bytes) -> dict[str, str] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return dict(value)
+
+    def set(self, key: bytes, value: dict[str, str]) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, dict(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Upstream responses are deterministic enough (low temperature) that an
+# identical (provider, model, input) can be served from memory.  Fallback
+# output is never cached — it is cheap and upstream may recover.
+_GENERATE_CACHE = _TTLCache(maxsize=512, ttl=3600)
+_EXPLAIN_CACHE = _TTLCache(maxsize=512, ttl=3600)
+
+
+def _cache_key(provider: str, model: str, payload: str) -> bytes:
+    return hashlib.blake2b(
+        f"{provider}|{model}|{payload}".encode(), digest_size=16
+    ).digest()
+
+
+def clear_response_cache() -> None:
+    """Drop all cached upstream responses."""
+    _GENERATE_CACHE.clear()
+    _EXPLAIN_CACHE.clear()
+
+
+# ── Upstream throttling ─────────────────────────────────────────────────
+
+
+class _RateLimiter:
+    """Async token bucket allowing *rate* acquisitions per *period* seconds."""
+
+    def __init__(self, rate: float, period: float = 60.0) -> None:
+        self.rate = rate
+        self.period = period
+        self._tokens = rate
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.rate / self.period
+            self._tokens = min(self.rate, self._tokens + refill)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+
+_RETRY_BASE_DELAY_S = 0.5
+# Keyed by event loop: semaphores bind to the loop that first waits on them,
+# so each loop (e.g. successive TestClient or asyncio.run sessions) gets its
+# own set, dropped along with the loop.
+_provider_limits: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, tuple[asyncio.Semaphore, _RateLimiter | None]]
+] = weakref.WeakKeyDictionary()
+
+
+def _get_provider_limits(provider: str) -> tuple[asyncio.Semaphore, _RateLimiter | None]:
+    loop = asyncio.get_running_loop()
+    loop_limits = _provider_limits.get(loop)
+    if loop_limits is None:
+        loop_limits = _provider_limits[loop] = {}
+    limits = loop_limits.get(provider)
+    if limits is None:
+        rpm = envs.AXIOM_AI_RPM
+        limits = (
+            asyncio.Semaphore(envs.AXIOM_AI_MAX_CONCURRENCY),
+            _RateLimiter(rpm) if rpm > 0 else None,
+        )
+        loop_limits[provider] = limits
+    return limits
+
+
+async def _call_upstream(provider: str, fn: Any, *args: Any) -> Any:
+    """Await ``fn(*args)`` under the provider's concurrency and (optional) RPM budget.
+
+    Quota errors (anything mapping to 429) are retried with jittered
+    exponential backoff before being re-raised.
+    """
+    sem, limiter = _get_provider_limits(provider)
+    max_retries = envs.AXIOM_AI_MAX_RETRIES
+    for attempt in range(max_retries + 1):
+        async with sem:
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                return await fn(*args)
+            except Exception as exc:
+                if attempt == max_retries or _map_upstream_exception(exc).status_code != 429:
+                    raise
+        await asyncio.sleep(_RETRY_BASE_DELAY_S * 2**attempt * (0.5 + random.random()))
+
+
 # ── Public API (used by app.py endpoints) ───────────────────────────────
 
 
@@ -427,36 +661,36 @@ def validate_model(model_name: str | None) -> str | None:
     return model_name
 
 
-def _dispatch_generate(prompt: str, model: str | None) -> tuple[str, str, str]:
+async def _dispatch_generate(
+    provider: str, prompt: str, model: str | None
+) -> tuple[str, str, str]:
     """Route to the correct backend. Returns (text, model_used, provider)."""
-    provider = _cfg_provider()
     if provider == "openai":
-        text, name = _openai_generate(prompt, model)
+        text, name = await _call_upstream("openai", _openai_generate, prompt, model)
         return text, name, "openai"
     else:
-        text, name = _gemini_generate(prompt, model)
+        text, name = await _call_upstream("gemini", _gemini_generate, prompt, model)
         return text, name, "gemini"
 
 
-def _dispatch_explain(evidence: dict, model: str | None) -> tuple[str, str, str]:
+async def _dispatch_explain(
+    provider: str, evidence: dict, model: str | None
+) -> tuple[str, str, str]:
     """Route to the correct backend. Returns (text, model_used, provider)."""
-    provider = _cfg_provider()
     if provider == "openai":
-        text, name = _openai_explain(evidence, model)
+        text, name = await _call_upstream("openai", _openai_explain, evidence, model)
         return text, name, "openai"
     else:
-        text, name = _gemini_explain(evidence, model)
+        text, name = await _call_upstream("gemini", _gemini_explain, evidence, model)
         return text, name, "gemini"
 
 
-def generate_taskspec(prompt: str, model: str | None = None) -> dict[str, str]:
+async def generate_taskspec(prompt: str, model: str | None = None) -> dict[str, str]:
     """Generate a TaskSpec YAML. Returns {"yaml", "model_used", "provider"}.
 
     Falls back to local generator when upstream fails and fallback is enabled.
     """
-    provider = _cfg_provider()
-    has_key = _has_api_key()
-    fallback = _cfg_demo_fallback()
+    provider, has_key, fallback = _availability()
 
     if provider == "none" or (not has_key and fallback):
         return {
@@ -472,9 +706,16 @@ def generate_taskspec(prompt: str, model: str | None = None) -> dict[str, str]:
             detail=f"{key_name} is not set — AI features are unavailable.",
         )
 
+    key = _cache_key(provider, model or _cfg_default_model(), prompt)
+    cached = _GENERATE_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        yaml_text, model_used, prov = _dispatch_generate(prompt, model)
-        return {"yaml": yaml_text, "model_used": model_used, "provider": prov}
+        yaml_text, model_used, prov = await _dispatch_generate(provider, prompt, model)
+        result = {"yaml": yaml_text, "model_used": model_used, "provider": prov}
+        _GENERATE_CACHE.set(key, result)
+        return result
     except HTTPException:
         raise
     except Exception as exc:
@@ -487,14 +728,29 @@ def generate_taskspec(prompt: str, model: str | None = None) -> dict[str, str]:
         raise _map_upstream_exception(exc)
 
 
-def explain_evidence(evidence: dict, model: str | None = None) -> dict[str, str]:
+async def generate_taskspec_many(
+    prompts: list[str], model: str | None = None, max_concurrency: int = 8,
+) -> list[dict[str, str]]:
+    """Generate one TaskSpec per prompt, fanning out concurrently.
+
+    At most *max_concurrency* upstream calls are in flight at once.  Results
+    are returned in the same order as *prompts*.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(prompt: str) -> dict[str, str]:
+        async with sem:
+            return await generate_taskspec(prompt, model=model)
+
+    return list(await asyncio.gather(*(_one(p) for p in prompts)))
+
+
+async def explain_evidence(evidence: dict, model: str | None = None) -> dict[str, str]:
     """Explain an EvidencePacket. Returns {"explanation", "model_used", "provider"}.
 
     Falls back to local explainer when upstream fails and fallback is enabled.
     """
-    provider = _cfg_provider()
-    has_key = _has_api_key()
-    fallback = _cfg_demo_fallback()
+    provider, has_key, fallback = _availability()
 
     if provider == "none" or (not has_key and fallback):
         return {
@@ -510,9 +766,18 @@ def explain_evidence(evidence: dict, model: str | None = None) -> dict[str, str]
             detail=f"{key_name} is not set — AI features are unavailable.",
         )
 
+    key = _cache_key(
+        provider, model or _cfg_default_model(), json.dumps(evidence, sort_keys=True)
+    )
+    cached = _EXPLAIN_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        explanation, model_used, prov = _dispatch_explain(evidence, model)
-        return {"explanation": explanation, "model_used": model_used, "provider": prov}
+        explanation, model_used, prov = await _dispatch_explain(provider, evidence, model)
+        result = {"explanation": explanation, "model_used": model_used, "provider": prov}
+        _EXPLAIN_CACHE.set(key, result)
+        return result
     except HTTPException:
         raise
     except Exception as exc:
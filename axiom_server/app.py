@@ -2,31 +2,47 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import gzip
 import os
-import uuid
+import secrets
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+import anyio.to_thread
+import jinja2
+import orjson
 import yaml
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from axiom_tfg.evidence import run_gates, write_evidence
-from axiom_tfg.models import TaskSpec
+from axiom_tfg.evidence import run_gates
+from axiom_tfg.models import EvidencePacket, TaskSpec
+from axiom_tfg.utils import dump_json_bytes, write_json
 
-from axiom_server import ai
+from axiom_server import ai, envs
 from axiom_server.db import RunStore
 from axiom_server.sweep import (
     SweepRequest,
     build_summary,
     generate_variants,
     parse_variations,
+    run_variants,
+    shutdown_gate_pool,
 )
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # ── configurable paths ────────────────────────────────────────────────────
 
 DATA_DIR = Path(os.environ.get("AXIOM_DATA_DIR", "data"))
@@ -37,10 +53,47 @@ PUBLIC_BASE_URL = os.environ.get("AXIOM_PUBLIC_BASE_URL", "").rstrip("/")
 
 # ── app setup ─────────────────────────────────────────────────────────────
 
-app = FastAPI(title="axiom-tfg", version="0.1.0")
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (FastAPI's own class is deprecated)."""
+
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    # Blocking work (gates, disk, SQLite) is offloaded to threads from both
+    # asyncio.to_thread and FastAPI's sync endpoints; size both pools alike.
+    workers = envs.AXIOM_THREADPOOL_SIZE
+    anyio.to_thread.current_default_thread_limiter().total_tokens = workers
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="axiom")
+    )
+    yield
+    # Release pooled upstream connections held by the AI clients.
+    await ai.aclose()
+    shutdown_gate_pool()
+
+
+app = FastAPI(
+    title="axiom-tfg",
+    version="0.1.0",
+    lifespan=_lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 _TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
-templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
+# Templates ship with the package and never change at runtime: compile each
+# once per process and keep it forever.
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(_TEMPLATES_DIR)),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+)
 
 _STATIC_DIR = Path(__file__).resolve().parent / "static"
 app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
@@ -51,7 +104,7 @@ store = RunStore(DATA_DIR / "axiom.db")
 
 
 @app.get("/health")
-def health() -> dict:
+async def health() -> dict:
     return {"status": "ok"}
 
 
@@ -59,8 +112,8 @@ def health() -> dict:
 
 
 @app.get("/", response_class=HTMLResponse)
-def index(request: Request) -> HTMLResponse:
-    runs = store.list_recent(limit=50)
+async def index(request: Request) -> HTMLResponse:
+    runs = await asyncio.to_thread(store.list_recent, 50)
     ai_status = ai.get_status()
     return templates.TemplateResponse(
         request, "index.html", {
@@ -74,43 +127,103 @@ def index(request: Request) -> HTMLResponse:
 # ── API: create run ──────────────────────────────────────────────────────
 
 
+# Built once at import so per-request validation/serialisation reuses the
+# compiled core schema directly.
+_TASKSPEC_ADAPTER = TypeAdapter(TaskSpec)
+_EVIDENCE_ADAPTER = TypeAdapter(EvidencePacket)
+
+
+def _parse_task_body(body: bytes, content_type: str) -> object:
+    """Parse raw request bytes as JSON or YAML depending on *content_type*.
+
+    Both parsers accept bytes directly, so the body is never decoded to an
+    intermediate ``str``.
+    """
+    if "json" in content_type:
+        return orjson.loads(body)
+    return yaml.load(body, Loader=_YamlLoader)
+
+
+async def _read_json_object(request: Request) -> dict:
+    """Parse a JSON request body straight from bytes with orjson."""
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as exc:
+        raise HTTPException(status_code=400, detail=f"JSON parse error: {exc}")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
+    return body
+
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` header allows gzip (q-values honoured)."""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+def _persist_run_evidence(evidence: dict, run_id: str) -> tuple[bytes, Path | None]:
+    """Serialise *evidence* for *run_id*.
+
+    Returns the gzipped JSON blob for the run store and, unless
+    ``AXIOM_EVIDENCE_FILES`` is turned off, the path of the on-disk copy.
+    Compressed copies live only in the store.
+    """
+    data = dump_json_bytes(evidence)
+    blob = gzip.compress(data, mtime=0)
+    if not envs.AXIOM_EVIDENCE_FILES:
+        return blob, None
+    # Runs are keyed by run_id, not task_id (task ids repeat across runs).
+    evidence_dir = RUNS_DIR / run_id
+    evidence_dir.mkdir(parents=True, exist_ok=True)
+    run_evidence = evidence_dir / "evidence.json"
+    run_evidence.write_bytes(data)
+    return blob, run_evidence
+
+
 @app.post("/runs")
-async def create_run(request: Request) -> JSONResponse:
+async def create_run(request: Request) -> ORJSONResponse:
     content_type = request.headers.get("content-type", "")
     body = await request.body()
-    text = body.decode("utf-8")
 
     # Parse input — accept YAML (text/plain, application/x-yaml) or JSON.
+    # Parsing, gates, and disk I/O run in worker threads so the event loop
+    # stays responsive for other requests.
     try:
-        if "json" in content_type:
-            raw = json.loads(text)
-        else:
-            raw = yaml.safe_load(text)
+        raw = await asyncio.to_thread(_parse_task_body, body, content_type)
     except Exception as exc:
         raise HTTPException(status_code=400, detail=f"Parse error: {exc}")
 
     # Validate against TaskSpec.
     try:
-        spec = TaskSpec.model_validate(raw)
+        spec = _TASKSPEC_ADAPTER.validate_python(raw)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors())
 
     # Run the gate pipeline.
-    packet = run_gates(spec)
+    packet = await asyncio.to_thread(run_gates, spec)
+    evidence = _EVIDENCE_ADAPTER.dump_python(packet, mode="json")
 
-    # Persist evidence to disk.
-    run_id = uuid.uuid4().hex[:12]
-    evidence_dir = RUNS_DIR / run_id
-    evidence_path = write_evidence(packet, RUNS_DIR)
-    # write_evidence writes to <out>/<task_id>/evidence.json — we also want
-    # a deterministic path keyed by run_id, so symlink or copy.
-    run_evidence = evidence_dir / "evidence.json"
-    if not run_evidence.exists():
-        evidence_dir.mkdir(parents=True, exist_ok=True)
-        run_evidence.write_text(
-            json.dumps(packet.model_dump(mode="json"), indent=2) + "\n",
-            encoding="utf-8",
-        )
+    # Serialise evidence (and write the on-disk copy, if enabled).
+    run_id = secrets.token_hex(6)
+    blob, run_evidence = await asyncio.to_thread(_persist_run_evidence, evidence, run_id)
 
     # Derive top fix summary + structured patch for the UI.
     top_fix: str | None = None
@@ -129,19 +242,21 @@ async def create_run(request: Request) -> JSONResponse:
 
     now = datetime.now(timezone.utc).isoformat()
 
-    store.insert(
+    await asyncio.to_thread(
+        store.insert,
         run_id=run_id,
         task_id=spec.task_id,
         created_at=now,
         verdict=packet.verdict.value,
         failed_gate=packet.failed_gate,
         top_fix=top_fix,
-        evidence_path=str(run_evidence),
+        evidence_path=str(run_evidence) if run_evidence else None,
+        evidence_blob=blob,
     )
 
     evidence_url = _make_evidence_url(run_id)
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "run_id": run_id,
             "verdict": packet.verdict.value,
@@ -149,7 +264,7 @@ async def create_run(request: Request) -> JSONResponse:
             "top_fix": top_fix,
             "top_fix_patch": top_fix_patch,
             "evidence_url": evidence_url,
-            "evidence": packet.model_dump(mode="json"),
+            "evidence": evidence,
         },
         status_code=200,
     )
@@ -159,16 +274,16 @@ async def create_run(request: Request) -> JSONResponse:
 
 
 @app.get("/runs")
-def list_runs(limit: int = 50) -> list[dict]:
-    return store.list_recent(limit=limit)
+async def list_runs(limit: int = 50) -> list[dict]:
+    return await asyncio.to_thread(store.list_recent, limit)
 
 
 # ── API: single run ──────────────────────────────────────────────────────
 
 
 @app.get("/runs/{run_id}")
-def get_run(run_id: str) -> dict:
-    row = store.get(run_id)
+async def get_run(run_id: str) -> dict:
+    row = await asyncio.to_thread(store.get, run_id)
     if not row:
         raise HTTPException(status_code=404, detail="Run not found")
     return row
@@ -178,25 +293,69 @@ def get_run(run_id: str) -> dict:
 
 
 @app.get("/runs/{run_id}/evidence")
-def get_evidence(run_id: str) -> FileResponse:
-    row = store.get(run_id)
+async def get_evidence(run_id: str, request: Request) -> Response:
+    blob = await asyncio.to_thread(store.get_evidence_blob, run_id)
+    if blob is None:
+        return await _get_evidence_file(run_id, request)
+    # Evidence never changes once a run is stored, so the run id is its tag.
+    # The gzip and identity bodies share the tag, so caches must key on
+    # Accept-Encoding for both the 200 and the 304.
+    headers = {
+        "ETag": f'W/"{run_id}"',
+        "Cache-Control": "private, max-age=10",
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    if blob[:2] == _GZIP_MAGIC:
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            blob = gzip.decompress(blob)
+    return Response(content=blob, media_type="application/json", headers=headers)
+
+
+async def _get_evidence_file(run_id: str, request: Request) -> Response:
+    """Serve evidence from disk for runs stored before evidence blobs."""
+    row = await asyncio.to_thread(store.get, run_id)
     if not row:
         raise HTTPException(status_code=404, detail="Run not found")
+    if not row["evidence_path"]:
+        raise HTTPException(status_code=404, detail="Evidence file missing")
     path = Path(row["evidence_path"])
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Evidence file missing")
-    return FileResponse(path, media_type="application/json")
+    # Evidence is written once per run, so mtime+size identifies the content.
+    headers = {
+        "ETag": f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Cache-Control": "private, max-age=10",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    # FileResponse streams via os.sendfile where the server supports it.
+    return FileResponse(path, media_type="application/json", headers=headers, stat_result=st)
 
 
 # ── examples endpoints ────────────────────────────────────────────────────
 
 
+# Examples ship with the package, so list them once at import.
+_EXAMPLE_NAMES: tuple[str, ...] = (
+    tuple(sorted(p.name for p in EXAMPLES_DIR.glob("*.yaml"))) if EXAMPLES_DIR.is_dir() else ()
+)
+
+
+@lru_cache(maxsize=64)
+def _read_example(name: str) -> str:
+    return (EXAMPLES_DIR / name).read_text(encoding="utf-8")
+
+
 @app.get("/examples")
 def list_examples() -> list[str]:
     """Return sorted list of example YAML filenames."""
-    if not EXAMPLES_DIR.is_dir():
-        return []
-    return sorted(p.name for p in EXAMPLES_DIR.glob("*.yaml"))
+    return list(_EXAMPLE_NAMES)
 
 
 @app.get("/examples/{name}")
@@ -205,10 +364,9 @@ def get_example(name: str) -> PlainTextResponse:
     # Guard against path traversal.
     if "/" in name or "\\" in name or name != Path(name).name:
         raise HTTPException(status_code=400, detail="Invalid example name")
-    path = EXAMPLES_DIR / name
-    if not path.is_file():
+    if name not in _EXAMPLE_NAMES:
         raise HTTPException(status_code=404, detail="Example not found")
-    return PlainTextResponse(path.read_text(encoding="utf-8"))
+    return PlainTextResponse(_read_example(name))
 
 
 # ── sweep endpoints ──────────────────────────────────────────────────────
@@ -221,16 +379,72 @@ def _make_evidence_url(run_id: str) -> str:
     return url
 
 
+def _record_sweep_runs(
+    variants: list[TaskSpec],
+    packets: list[EvidencePacket],
+    now: str,
+) -> tuple[list[dict], list[dict]]:
+    """Persist one run per variant; return (run rows, rows with evidence)."""
+    runs: list[dict] = []
+    all_results: list[dict] = []
+    store_rows: list[dict] = []
+
+    for spec, packet in zip(variants, packets):
+        evidence = _EVIDENCE_ADAPTER.dump_python(packet, mode="json")
+
+        run_id = secrets.token_hex(6)
+        blob, run_evidence = _persist_run_evidence(evidence, run_id)
+
+        top_fix: str | None = None
+        if packet.counterfactual_fixes:
+            top_fix = packet.counterfactual_fixes[0].type.value
+
+        store_rows.append({
+            "run_id": run_id,
+            "task_id": spec.task_id,
+            "created_at": now,
+            "verdict": packet.verdict.value,
+            "failed_gate": packet.failed_gate,
+            "top_fix": top_fix,
+            "evidence_path": str(run_evidence) if run_evidence else None,
+            "evidence_blob": blob,
+        })
+
+        result_row = {
+            "run_id": run_id,
+            "verdict": packet.verdict.value,
+            "failed_gate": packet.failed_gate,
+            "evidence_url": _make_evidence_url(run_id),
+            "evidence": evidence,
+        }
+        runs.append({
+            "run_id": run_id,
+            "verdict": packet.verdict.value,
+            "failed_gate": packet.failed_gate,
+            "evidence_url": _make_evidence_url(run_id),
+        })
+        all_results.append(result_row)
+
+    # One transaction for the whole sweep instead of a commit per variant.
+    store.insert_many(store_rows)
+    return runs, all_results
+
+
+def _persist_sweep(sweep_data: dict) -> None:
+    SWEEPS_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(SWEEPS_DIR / f"{sweep_data['sweep_id']}.json", sweep_data)
+
+
 @app.post("/sweeps")
-async def create_sweep(request: Request) -> JSONResponse:
-    body = await request.json()
+async def create_sweep(request: Request) -> ORJSONResponse:
+    body = await _read_json_object(request)
 
     # Parse base task from YAML text or JSON object.
     base_yaml = body.get("base_yaml")
     base_json = body.get("base_json")
     if base_yaml:
         try:
-            raw = yaml.safe_load(base_yaml)
+            raw = yaml.load(base_yaml, Loader=_YamlLoader)
         except Exception as exc:
             raise HTTPException(status_code=400, detail=f"YAML parse error: {exc}")
     elif base_json:
@@ -239,7 +453,7 @@ async def create_sweep(request: Request) -> JSONResponse:
         raise HTTPException(status_code=400, detail="base_yaml or base_json is required")
 
     try:
-        base_task = TaskSpec.model_validate(raw)
+        base_task = _TASKSPEC_ADAPTER.validate_python(raw)
     except ValidationError as exc:
         raise HTTPException(status_code=422, detail=exc.errors())
 
@@ -255,60 +469,24 @@ async def create_sweep(request: Request) -> JSONResponse:
         seed=seed,
     )
 
-    variants = generate_variants(base_task, sweep_req)
-
-    # Run each variant through the gate pipeline and persist.
-    runs: list[dict] = []
-    all_results: list[dict] = []
-
-    for spec in variants:
-        packet = run_gates(spec)
-
-        run_id = uuid.uuid4().hex[:12]
-        evidence_dir = RUNS_DIR / run_id
-        evidence_dir.mkdir(parents=True, exist_ok=True)
-        run_evidence = evidence_dir / "evidence.json"
-        run_evidence.write_text(
-            json.dumps(packet.model_dump(mode="json"), indent=2) + "\n",
-            encoding="utf-8",
-        )
-
-        top_fix: str | None = None
-        if packet.counterfactual_fixes:
-            top_fix = packet.counterfactual_fixes[0].type.value
+    try:
+        variants = generate_variants(base_task, sweep_req)
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.errors())
 
-        now = datetime.now(timezone.utc).isoformat()
-        store.insert(
-            run_id=run_id,
-            task_id=spec.task_id,
-            created_at=now,
-            verdict=packet.verdict.value,
-            failed_gate=packet.failed_gate,
-            top_fix=top_fix,
-            evidence_path=str(run_evidence),
-        )
+    # Gates, serialisation, and disk/DB writes all run off the event loop.
+    packets = await asyncio.to_thread(run_variants, variants)
 
-        result_row = {
-            "run_id": run_id,
-            "verdict": packet.verdict.value,
-            "failed_gate": packet.failed_gate,
-            "evidence_url": _make_evidence_url(run_id),
-            "evidence": packet.model_dump(mode="json"),
-        }
-        runs.append({
-            "run_id": run_id,
-            "verdict": packet.verdict.value,
-            "failed_gate": packet.failed_gate,
-            "evidence_url": _make_evidence_url(run_id),
-        })
-        all_results.append(result_row)
+    # Every run in a sweep shares the sweep's logical creation time.
+    now = datetime.now(timezone.utc).isoformat()
+    runs, all_results = await asyncio.to_thread(_record_sweep_runs, variants, packets, now)
 
     summary = build_summary(all_results)
 
-    sweep_id = uuid.uuid4().hex[:12]
+    sweep_id = secrets.token_hex(6)
     sweep_data = {
         "sweep_id": sweep_id,
-        "created_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": now,
         "request": {
             "base_task_id": base_task.task_id,
             "n": n,
@@ -317,14 +495,9 @@ async def create_sweep(request: Request) -> JSONResponse:
         "summary": summary,
         "run_ids": [r["run_id"] for r in runs],
     }
-    SWEEPS_DIR.mkdir(parents=True, exist_ok=True)
-    sweep_path = SWEEPS_DIR / f"{sweep_id}.json"
-    sweep_path.write_text(
-        json.dumps(sweep_data, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    await asyncio.to_thread(_persist_sweep, sweep_data)
 
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "sweep_id": sweep_id,
         "n": n,
         "seed": seed,
@@ -334,12 +507,12 @@ async def create_sweep(request: Request) -> JSONResponse:
 
 
 @app.get("/sweeps/{sweep_id}")
-def get_sweep(sweep_id: str) -> JSONResponse:
+def get_sweep(sweep_id: str) -> ORJSONResponse:
     path = SWEEPS_DIR / f"{sweep_id}.json"
     if not path.is_file():
         raise HTTPException(status_code=404, detail="Sweep not found")
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return JSONResponse(content=data)
+    data = orjson.loads(path.read_bytes())
+    return ORJSONResponse(content=data)
 
 
 # ── AI endpoints ─────────────────────────────────────────────────────────
@@ -359,13 +532,13 @@ def _require_ai() -> None:
 
 
 @app.get("/ai/status")
-def ai_status_endpoint() -> JSONResponse:
-    return JSONResponse(content=ai.get_status())
+async def ai_status_endpoint() -> ORJSONResponse:
+    return ORJSONResponse(content=ai.get_status())
 
 
 @app.get("/ai/models")
-def ai_models() -> JSONResponse:
-    return JSONResponse(content={
+async def ai_models() -> ORJSONResponse:
+    return ORJSONResponse(content={
         "models": ai.get_models_allowlist(),
         "default": ai.get_default_model(),
         "provider": ai.get_status()["provider"],
@@ -373,24 +546,46 @@ def ai_models() -> JSONResponse:
 
 
 @app.post("/ai/generate")
-async def ai_generate(request: Request) -> JSONResponse:
+async def ai_generate(request: Request) -> ORJSONResponse:
     _require_ai()
-    body = await request.json()
+    body = await _read_json_object(request)
     prompt = body.get("prompt", "")
     if not prompt:
         raise HTTPException(status_code=400, detail="prompt is required")
     model = ai.validate_model(body.get("model"))
-    result = ai.generate_taskspec(prompt, model=model)
-    return JSONResponse(content=result)
+    result = await ai.generate_taskspec(prompt, model=model)
+    return ORJSONResponse(content=result)
+
+
+_AI_BATCH_MAX_PROMPTS = 32
+
+
+@app.post("/ai/generate/batch")
+async def ai_generate_batch(request: Request) -> ORJSONResponse:
+    _require_ai()
+    body = await _read_json_object(request)
+    prompts = body.get("prompts")
+    if not isinstance(prompts, list) or not prompts:
+        raise HTTPException(status_code=400, detail="prompts must be a non-empty list")
+    if len(prompts) > _AI_BATCH_MAX_PROMPTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {_AI_BATCH_MAX_PROMPTS} prompts per batch",
+        )
+    if not all(isinstance(p, str) and p for p in prompts):
+        raise HTTPException(status_code=400, detail="every prompt must be a non-empty string")
+    model = ai.validate_model(body.get("model"))
+    results = await ai.generate_taskspec_many(prompts, model=model)
+    return ORJSONResponse(content={"results": results})
 
 
 @app.post("/ai/explain")
-async def ai_explain(request: Request) -> JSONResponse:
+async def ai_explain(request: Request) -> ORJSONResponse:
     _require_ai()
-    body = await request.json()
+    body = await _read_json_object(request)
     evidence = body.get("evidence")
     if not evidence:
         raise HTTPException(status_code=400, detail="evidence is required")
     model = ai.validate_model(body.get("model"))
-    result = ai.explain_evidence(evidence, model=model)
-    return JSONResponse(content=result)
+    result = await ai.explain_evidence(evidence, model=model)
+    return ORJSONResponse(content=result)
@@ -1,10 +1,14 @@
-"""SQLite storage for run metadata."""
+"""SQLite storage for run metadata and evidence."""
 
 from __future__ import annotations
 
 import sqlite3
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 
+from axiom_server import envs
+
 _DEFAULT_DB = Path("data/axiom.db")
 
 _SCHEMA = """\
@@ -15,25 +19,78 @@ CREATE TABLE IF NOT EXISTS runs (
     verdict       TEXT NOT NULL,
     failed_gate   TEXT,
     top_fix       TEXT,
-    evidence_path TEXT NOT NULL
+    evidence_path TEXT,
+    evidence_blob BLOB
 );
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC);
+"""
+
+# Metadata columns returned by get/list_recent; the evidence blob is only
+# read by get_evidence_blob.
+_COLUMNS = "run_id, task_id, created_at, verdict, failed_gate, top_fix, evidence_path"
+
+# Databases created before evidence_blob existed have evidence_path NOT NULL,
+# which SQLite cannot relax in place, so the table is rebuilt once.
+_MIGRATE_ADD_BLOB = f"""\
+BEGIN;
+DROP INDEX IF EXISTS idx_runs_created_at;
+ALTER TABLE runs RENAME TO runs_legacy;
+{_SCHEMA}
+INSERT INTO runs ({_COLUMNS}) SELECT {_COLUMNS} FROM runs_legacy;
+DROP TABLE runs_legacy;
+COMMIT;
 """
 
+# WAL lets readers proceed while a write is pending, and synchronous=NORMAL
+# drops the per-commit fsync of the rollback journal (still crash-safe in WAL).
+_WAL_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def _open(db_path: Path, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
+    conn.row_factory = sqlite3.Row
+    if envs.AXIOM_SQLITE_WAL:
+        for pragma in _WAL_PRAGMAS:
+            conn.execute(pragma)
+    return conn
+
 
 def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open the shared writer connection, creating/migrating the schema."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path), check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute(_SCHEMA)
-    conn.commit()
+    conn = _open(db_path, check_same_thread=False)
+    columns = {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}
+    if columns and "evidence_blob" not in columns:
+        conn.executescript(_MIGRATE_ADD_BLOB)
+    conn.executescript(_SCHEMA)
     return conn
 
 
 class RunStore:
-    """Thin wrapper around an SQLite database for run records."""
+    """Thin wrapper around an SQLite database for run records.
+
+    Writes go through one shared connection under a lock; reads use a
+    connection per thread so they never queue behind each other (or, in WAL
+    mode, behind a pending write).
+    """
 
     def __init__(self, db_path: Path = _DEFAULT_DB) -> None:
-        self._conn = _connect(db_path)
+        self._db_path = db_path
+        self._writer = _connect(db_path)
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _open(self._db_path)
+        return conn
 
     def insert(
         self,
@@ -44,23 +101,45 @@ class RunStore:
         verdict: str,
         failed_gate: str | None,
         top_fix: str | None,
-        evidence_path: str,
+        evidence_path: str | None,
+        evidence_blob: bytes | None = None,
     ) -> None:
-        self._conn.execute(
-            "INSERT INTO runs (run_id, task_id, created_at, verdict, failed_gate, top_fix, evidence_path) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (run_id, task_id, created_at, verdict, failed_gate, top_fix, evidence_path),
-        )
-        self._conn.commit()
+        with self._write_lock, self._writer:
+            self._writer.execute(
+                f"INSERT INTO runs ({_COLUMNS}, evidence_blob) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, task_id, created_at, verdict, failed_gate, top_fix, evidence_path, evidence_blob),
+            )
+
+    def insert_many(self, rows: Iterable[dict]) -> None:
+        """Insert many run records in a single transaction (one commit).
+
+        Each row is a dict with the same keys as :meth:`insert`'s arguments,
+        ``evidence_blob`` included.
+        """
+        with self._write_lock, self._writer:
+            self._writer.executemany(
+                f"INSERT INTO runs ({_COLUMNS}, evidence_blob) "
+                "VALUES (:run_id, :task_id, :created_at, :verdict, :failed_gate, :top_fix, "
+                ":evidence_path, :evidence_blob)",
+                rows,
+            )
 
     def get(self, run_id: str) -> dict | None:
-        row = self._conn.execute(
-            "SELECT * FROM runs WHERE run_id = ?", (run_id,)
+        row = self._reader().execute(
+            f"SELECT {_COLUMNS} FROM runs WHERE run_id = ?", (run_id,)
         ).fetchone()
         return dict(row) if row else None
 
+    def get_evidence_blob(self, run_id: str) -> bytes | None:
+        """Return the stored evidence bytes, or None if the run has none."""
+        row = self._reader().execute(
+            "SELECT evidence_blob FROM runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return row[0] if row else None
+
     def list_recent(self, limit: int = 50) -> list[dict]:
-        rows = self._conn.execute(
-            "SELECT * FROM runs ORDER BY created_at DESC LIMIT ?", (limit,)
+        rows = self._reader().execute(
+            f"SELECT {_COLUMNS} FROM runs ORDER BY created_at DESC LIMIT ?", (limit,)
         ).fetchall()
         return [dict(r) for r in rows]
@@ -0,0 +1,87 @@
+"""Environment variables read by the axiom-tfg server, declared in one place.
+
+Access values as module attributes::
+
+    from axiom_server import envs
+
+    envs.AXIOM_AI_PROVIDER      # "gemini"
+
+Each attribute access evaluates its entry in ``environment_variables`` so
+values changed at runtime (tests, hot reloads) are picked up.  Parsing that
+is more than a lookup (comma-separated allowlists) is memoised on the raw
+string, so repeated reads of an unchanged variable cost a dict hit.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Any, Callable
+
+_TRUTHY = ("true", "1", "yes")
+
+
+@lru_cache(maxsize=16)
+def _parse_csv(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated list, dropping blanks."""
+    return tuple(m.strip() for m in raw.split(",") if m.strip())
+
+
+environment_variables: dict[str, Callable[[], Any]] = {
+    # Which AI backend to use: "gemini", "openai", or "none".
+    "AXIOM_AI_PROVIDER": lambda: os.environ.get("AXIOM_AI_PROVIDER", "gemini").lower(),
+    # Serve deterministic local output when no key is set or upstream fails.
+    "AXIOM_AI_DEMO_FALLBACK": lambda: (
+        os.environ.get("AXIOM_AI_DEMO_FALLBACK", "false").lower() in _TRUTHY
+    ),
+    # Open the run store in WAL mode with relaxed fsync (set to 0 to keep
+    # SQLite's rollback-journal defaults).
+    "AXIOM_SQLITE_WAL": lambda: (
+        os.environ.get("AXIOM_SQLITE_WAL", "1").lower() in _TRUTHY
+    ),
+    # Also write data/runs/<run_id>/evidence.json for tools that read the
+    # files directly.  Evidence is always stored in the run database, which
+    # is what the API serves; set to 0 to skip the per-run files.
+    "AXIOM_EVIDENCE_FILES": lambda: (
+        os.environ.get("AXIOM_EVIDENCE_FILES", "true").lower() in _TRUTHY
+    ),
+    # Threads for blocking work offloaded from the event loop.
+    "AXIOM_THREADPOOL_SIZE": lambda: int(os.environ.get("AXIOM_THREADPOOL_SIZE", "64")),
+    # Worker processes for sweep gate evaluation.  Gates take microseconds,
+    # so the default (1) runs them in-process; set > 1 to opt into a pool.
+    "AXIOM_SWEEP_WORKERS": lambda: int(os.environ.get("AXIOM_SWEEP_WORKERS", "1")),
+    # Upstream throttling, applied per provider.  AXIOM_AI_RPM is opt-in:
+    # unset (or 0) leaves requests per minute unlimited.
+    "AXIOM_AI_MAX_CONCURRENCY": lambda: int(os.environ.get("AXIOM_AI_MAX_CONCURRENCY", "8")),
+    "AXIOM_AI_RPM": lambda: float(os.environ.get("AXIOM_AI_RPM", "0")),
+    "AXIOM_AI_MAX_RETRIES": lambda: int(os.environ.get("AXIOM_AI_MAX_RETRIES", "2")),
+    # Gemini.
+    "GOOGLE_API_KEY": lambda: os.environ.get("GOOGLE_API_KEY", ""),
+    "AXIOM_GEMINI_MODEL_DEFAULT": lambda: os.environ.get(
+        "AXIOM_GEMINI_MODEL_DEFAULT", "gemini-2.0-flash"
+    ),
+    "AXIOM_GEMINI_MODELS_ALLOWLIST": lambda: _parse_csv(
+        os.environ.get("AXIOM_GEMINI_MODELS_ALLOWLIST", "")
+    ),
+    # OpenAI-compatible (Groq, Together, OpenRouter, ...).
+    "AXIOM_OPENAI_API_KEY": lambda: os.environ.get("AXIOM_OPENAI_API_KEY", ""),
+    "AXIOM_OPENAI_BASE_URL": lambda: os.environ.get(
+        "AXIOM_OPENAI_BASE_URL", "https://api.groq.com/openai/v1"
+    ),
+    "AXIOM_OPENAI_MODEL_DEFAULT": lambda: os.environ.get(
+        "AXIOM_OPENAI_MODEL_DEFAULT", "llama-3.3-70b-versatile"
+    ),
+    "AXIOM_OPENAI_MODELS_ALLOWLIST": lambda: _parse_csv(
+        os.environ.get("AXIOM_OPENAI_MODELS_ALLOWLIST", "")
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in environment_variables:
+        return environment_variables[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(environment_variables.keys())
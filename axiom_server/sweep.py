@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import random
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-from axiom_tfg.models import TaskSpec
+from pydantic import TypeAdapter
+
+from axiom_tfg.evidence import run_gates_batch
+from axiom_tfg.models import EvidencePacket, SubstrateSpec, TaskSpec
+
+from axiom_server import envs
+
+_SUBSTRATE_ADAPTER = TypeAdapter(SubstrateSpec)
 
 
 @dataclass
@@ -68,67 +79,146 @@ def parse_variations(raw: dict | None) -> VariationSpec:
     )
 
 
+def _check_sampled_masses(base: TaskSpec, masses: list[float]) -> None:
+    """Validate the sampled masses once per sweep.
+
+    Variants are derived from an already-validated *base* and only differ in
+    sampled fields, so they are built without re-running pydantic
+    validation.  The only constrained sampled field (``mass_kg > 0``) is
+    monotone, so checking the smallest and largest sample covers every
+    variant.  Only values actually sampled are checked, so a range such as
+    ``[0, 1]`` is fine unless a sample lands on 0.  Raises ``ValidationError``.
+    """
+    if not masses:
+        return
+    substrate = _SUBSTRATE_ADAPTER.dump_python(base.substrate)
+    for mass in (min(masses), max(masses)):
+        _SUBSTRATE_ADAPTER.validate_python({**substrate, "mass_kg": mass})
+
+
 def generate_variants(base: TaskSpec, req: SweepRequest) -> list[TaskSpec]:
     """Generate *n* TaskSpec variants by sampling within provided ranges.
 
     Uses ``random.Random(seed)`` for full determinism — no numpy needed.
     """
+    v = req.variations
     rng = random.Random(req.seed)
     variants: list[TaskSpec] = []
+    masses: list[float] = []
 
+    # Only the sampled subtrees are copied; everything else (constructor,
+    # environment, ...) is shared by reference with *base*.
     for i in range(req.n):
-        data = base.model_dump()
-        data["task_id"] = f"{base.task_id}-sweep-{i:04d}"
-
-        v = req.variations
+        substrate = base.substrate
+        transformation = base.transformation
 
         if v.mass_kg is not None:
-            data["substrate"]["mass_kg"] = rng.uniform(v.mass_kg.min, v.mass_kg.max)
+            mass = rng.uniform(v.mass_kg.min, v.mass_kg.max)
+            masses.append(mass)
+            substrate = substrate.model_copy(update={"mass_kg": mass})
 
         if v.target_xyz is not None:
-            xyz = list(data["transformation"]["target_pose"]["xyz"])
+            xyz = list(transformation.target_pose.xyz)
             if v.target_xyz.x is not None:
                 xyz[0] = rng.uniform(v.target_xyz.x.min, v.target_xyz.x.max)
             if v.target_xyz.y is not None:
                 xyz[1] = rng.uniform(v.target_xyz.y.min, v.target_xyz.y.max)
             if v.target_xyz.z is not None:
                 xyz[2] = rng.uniform(v.target_xyz.z.min, v.target_xyz.z.max)
-            data["transformation"]["target_pose"]["xyz"] = xyz
+            target_pose = transformation.target_pose.model_copy(update={"xyz": tuple(xyz)})
+            transformation = transformation.model_copy(update={"target_pose": target_pose})
 
-        variants.append(TaskSpec.model_validate(data))
+        variants.append(base.model_copy(update={
+            "task_id": f"{base.task_id}-sweep-{i:04d}",
+            "substrate": substrate,
+            "transformation": transformation,
+        }))
 
+    _check_sampled_masses(base, masses)
     return variants
 
 
+# ── gate execution ───────────────────────────────────────────────────────
+
+_gate_pool: ProcessPoolExecutor | None = None
+_gate_pool_workers = 0
+_gate_pool_lock = threading.Lock()
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # The server is multi-threaded (thread pool, SQLite, HTTP clients), so
+    # workers must not be forked from it.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _get_gate_pool() -> tuple[ProcessPoolExecutor | None, int]:
+    """Return the shared gate worker pool and its size.
+
+    The pool is ``None`` when ``AXIOM_SWEEP_WORKERS`` is <= 1 (the default),
+    meaning gates run in-process.  A changed worker count replaces the pool.
+    """
+    global _gate_pool, _gate_pool_workers
+    workers = envs.AXIOM_SWEEP_WORKERS
+    with _gate_pool_lock:
+        if _gate_pool is not None and workers != _gate_pool_workers:
+            # In-flight maps on the old pool still complete.
+            _gate_pool.shutdown(wait=False)
+            _gate_pool = None
+        if workers <= 1:
+            return None, 1
+        if _gate_pool is None:
+            _gate_pool = ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+            _gate_pool_workers = workers
+        return _gate_pool, _gate_pool_workers
+
+
+def run_variants(variants: list[TaskSpec]) -> list[EvidencePacket]:
+    """Run the gate pipeline on every variant, preserving order.
+
+    Variants run in-process by default; with ``AXIOM_SWEEP_WORKERS`` > 1
+    they are spread across a process pool.  This call blocks; run it off the
+    event loop.
+    """
+    pool, workers = _get_gate_pool() if len(variants) > 1 else (None, 1)
+    if pool is None:
+        return run_gates_batch(variants)
+    # Each worker gets a contiguous chunk so batched gates still batch.
+    size = max(1, len(variants) // (4 * workers))
+    chunks = [variants[i:i + size] for i in range(0, len(variants), size)]
+    return [packet for batch in pool.map(run_gates_batch, chunks) for packet in batch]
+
+
+def shutdown_gate_pool() -> None:
+    """Stop the gate worker pool, if one was started."""
+    global _gate_pool
+    with _gate_pool_lock:
+        if _gate_pool is not None:
+            _gate_pool.shutdown(cancel_futures=True)
+            _gate_pool = None
+
+
 def build_summary(run_results: list[dict[str, Any]]) -> dict[str, Any]:
     """Build a summary from a list of run result dicts (verdict, failed_gate, etc.)."""
-    can_count = 0
-    cant_count = 0
-    by_gate: dict[str, int] = {}
-    by_reason: dict[str, int] = {}
+    verdicts = Counter(r["verdict"] for r in run_results)
+    by_gate = Counter(r["failed_gate"] for r in run_results if r.get("failed_gate"))
 
+    # Extract reason codes from evidence checks.
+    by_reason: Counter[str] = Counter()
     for r in run_results:
-        if r["verdict"] == "CAN":
-            can_count += 1
-        else:
-            cant_count += 1
-        gate = r.get("failed_gate")
-        if gate:
-            by_gate[gate] = by_gate.get(gate, 0) + 1
-
-        # Extract reason codes from evidence checks.
         evidence = r.get("evidence")
         if evidence:
-            for check in evidence.get("checks", []):
-                rc = check.get("reason_code")
-                if rc:
-                    by_reason[rc] = by_reason.get(rc, 0) + 1
-
-    top_reasons = sorted(by_reason.items(), key=lambda x: -x[1])
+            by_reason.update(
+                rc for check in evidence.get("checks", []) if (rc := check.get("reason_code"))
+            )
 
+    can_count = verdicts["CAN"]
     return {
         "CAN": can_count,
-        "HARD_CANT": cant_count,
-        "by_failed_gate": by_gate,
-        "top_reasons": [{"reason_code": rc, "count": c} for rc, c in top_reasons],
+        "HARD_CANT": len(run_results) - can_count,
+        "by_failed_gate": dict(by_gate),
+        "top_reasons": [
+            {"reason_code": rc, "count": c} for rc, c in by_reason.most_common()
+        ],
     }
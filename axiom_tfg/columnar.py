@@ -0,0 +1,52 @@
+"""Columnar (structure-of-arrays) view of many TaskSpecs for batch gates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from axiom_tfg.models import TaskSpec
+
+
+@dataclass
+class TaskSpecColumnar:
+    """The numeric fields batch gates need, one row per spec.
+
+    *specs* is kept alongside so failing rows can fall back to the per-spec
+    gate code for fix construction.
+    """
+
+    specs: list[TaskSpec]
+    bases: np.ndarray         # (N, 3) constructor base xyz
+    targets: np.ndarray       # (N, 3) target xyz
+    max_reach: np.ndarray     # (N,)
+    mass: np.ndarray          # (N,)
+    max_payload: np.ndarray   # (N,)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    @classmethod
+    def from_specs(cls, specs: list[TaskSpec]) -> TaskSpecColumnar:
+        n = len(specs)
+        bases = np.empty((n, 3), dtype=np.float64)
+        targets = np.empty((n, 3), dtype=np.float64)
+        max_reach = np.empty(n, dtype=np.float64)
+        mass = np.empty(n, dtype=np.float64)
+        max_payload = np.empty(n, dtype=np.float64)
+        for i, spec in enumerate(specs):
+            constructor = spec.constructor
+            bases[i] = constructor.base_pose.xyz
+            targets[i] = spec.transformation.target_pose.xyz
+            max_reach[i] = constructor.max_reach_m
+            mass[i] = spec.substrate.mass_kg
+            max_payload[i] = constructor.max_payload_kg
+        return cls(
+            specs=list(specs),
+            bases=bases,
+            targets=targets,
+            max_reach=max_reach,
+            mass=mass,
+            max_payload=max_payload,
+        )
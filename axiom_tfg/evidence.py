@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 from pathlib import Path
 
-import yaml
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
+from axiom_tfg.columnar import TaskSpecColumnar
 from axiom_tfg.gates.ik_feasibility import check_ik_feasibility
 from axiom_tfg.gates.keepout import check_keepout
 from axiom_tfg.gates.path_keepout import check_path_keepout
-from axiom_tfg.gates.payload import check_payload
-from axiom_tfg.gates.reachability import check_reachability
+from axiom_tfg.gates.payload import check_payload, check_payload_batch
+from axiom_tfg.gates.reachability import check_reachability, check_reachability_batch
 from axiom_tfg.models import (
     CounterfactualFix,
     EvidencePacket,
@@ -20,23 +20,30 @@ from axiom_tfg.models import (
     GateStatus,
     TaskSpec,
     Verdict,
+    now_iso,
 )
+from axiom_tfg.utils import dump_json_bytes, load_yaml
+
+# Built once at import so validation/serialisation reuse the compiled core
+# schema directly on every call.
+_TASKSPEC_ADAPTER = TypeAdapter(TaskSpec)
+_PACKET_ADAPTER = TypeAdapter(EvidencePacket)
 
 
 def load_task_spec(path: Path) -> TaskSpec:
     """Read a YAML file and return a validated TaskSpec."""
     with open(path, "r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh)
-    return TaskSpec.model_validate(raw)
+        raw = load_yaml(fh)
+    return _TASKSPEC_ADAPTER.validate_python(raw)
 
 
 def validate_task_spec(path: Path) -> list[str]:
     """Validate a YAML file against TaskSpec.  Returns a list of error strings
     (empty on success)."""
     with open(path, "r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh)
+        raw = load_yaml(fh)
     try:
-        TaskSpec.model_validate(raw)
+        _TASKSPEC_ADAPTER.validate_python(raw)
     except ValidationError as exc:
         return [str(e) for e in exc.errors()]
     return []
@@ -96,13 +103,22 @@ GATE_PIPELINE = [
 ]
 
 
-def run_gates(spec: TaskSpec) -> EvidencePacket:
+def run_gates(
+    spec: TaskSpec,
+    *,
+    precomputed: dict[Callable, tuple[GateResult, list[CounterfactualFix]]] | None = None,
+    created_at: str | None = None,
+) -> EvidencePacket:
     """Execute all gates in order, short-circuiting on the first failure.
 
     The IK feasibility gate is evaluated first when the constructor provides a
     ``urdf_path``.  If IK runs and passes, the simpler spherical reachability
     gate is skipped (IK subsumes it).  If no URDF is provided, IK is skipped
     and the spherical gate runs as the fallback.
+
+    *precomputed* maps pipeline gate functions to results already computed
+    for *spec* (see :func:`run_gates_batch`); those gates are not re-run.
+    *created_at* overrides the packet timestamp (defaults to now).
     """
     checks: list[GateResult] = []
     all_fixes: list[CounterfactualFix] = []
@@ -127,7 +143,10 @@ def run_gates(spec: TaskSpec) -> EvidencePacket:
         for gate_fn in GATE_PIPELINE:
             if skip_spherical_reach and gate_fn is check_reachability:
                 continue
-            result, fixes = gate_fn(spec)
+            if precomputed and gate_fn in precomputed:
+                result, fixes = precomputed[gate_fn]
+            else:
+                result, fixes = gate_fn(spec)
             _tag_level(result)
             checks.append(result)
             if result.status == GateStatus.FAIL:
@@ -155,16 +174,46 @@ def run_gates(spec: TaskSpec) -> EvidencePacket:
         checks=checks,
         counterfactual_fixes=all_fixes,
         validation_level_reached=_compute_level_reached(checks, failed_gate),
+        created_at=created_at or now_iso(),
     )
 
 
+def dump_evidence_bytes(packet: EvidencePacket) -> bytes:
+    """Serialise the packet to indented JSON bytes with a trailing newline."""
+    return dump_json_bytes(_PACKET_ADAPTER.dump_python(packet, mode="json"))
+
+
+def write_evidence_file(packet: EvidencePacket, path: Path) -> Path:
+    """Serialise the packet once, straight to *path* (parents are created)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(dump_evidence_bytes(packet))
+    return path
+
+
 def write_evidence(packet: EvidencePacket, out_dir: Path) -> Path:
     """Serialise the packet to ``<out_dir>/<task_id>/evidence.json``."""
-    dest = out_dir / packet.task_id
-    dest.mkdir(parents=True, exist_ok=True)
-    path = dest / "evidence.json"
-    path.write_text(
-        json.dumps(packet.model_dump(mode="json"), indent=2) + "\n",
-        encoding="utf-8",
-    )
-    return path
+    return write_evidence_file(packet, out_dir / packet.task_id / "evidence.json")
+
+
+def run_gates_batch(specs: list[TaskSpec]) -> list[EvidencePacket]:
+    """Run :func:`run_gates` on every spec.
+
+    The specs are laid out column-wise once so the reachability and payload
+    gates evaluate the whole batch as vector ops.  All packets share one
+    ``created_at`` timestamp.
+    """
+    if not specs:
+        return []
+
+    cols = TaskSpecColumnar.from_specs(specs)
+    reach = check_reachability_batch(cols)
+    payload = check_payload_batch(cols)
+    created_at = now_iso()
+    return [
+        run_gates(
+            spec,
+            precomputed={check_reachability: r, check_payload: p},
+            created_at=created_at,
+        )
+        for spec, r, p in zip(specs, reach, payload)
+    ]
@@ -16,6 +16,10 @@ from axiom_tfg.models import (
 GATE_NAME = "keepout"
 
 
+# At this many zones a single vectorised pass beats the per-zone loop.
+_VECTORISE_MIN_ZONES = 8
+
+
 def _point_in_expanded_aabb(
     point: list[float],
     zone: KeepoutZone,
@@ -26,12 +30,13 @@ def _point_in_expanded_aabb(
     The boundary itself is *outside* (open set), so that
     ``_minimal_escape`` can place a point on the face and have it pass.
     """
-    for i in range(3):
-        if point[i] <= zone.min_xyz[i] - buffer:
-            return False
-        if point[i] >= zone.max_xyz[i] + buffer:
-            return False
-    return True
+    x, y, z = point
+    lo, hi = zone.min_xyz, zone.max_xyz
+    return (
+        lo[0] - buffer < x < hi[0] + buffer
+        and lo[1] - buffer < y < hi[1] + buffer
+        and lo[2] - buffer < z < hi[2] + buffer
+    )
 
 
 def _minimal_escape(
@@ -42,32 +47,53 @@ def _minimal_escape(
     """Compute the smallest axis-aligned translation that moves *point* to
     just outside the expanded AABB.
 
-    Returns (escaped_point, L2_distance).
+    Returns (escaped_point, L2_distance).  The escaped point sits exactly on
+    the expanded face; it is not rounded, since rounding can pull it back
+    inside the open box (e.g. 0.8 + 0.05 == 0.8500000000000001 > 0.85).
     """
-    best_dist = math.inf
-    best_point: list[float] = list(point)
+    x, y, z = point
+    lo, hi = zone.min_xyz, zone.max_xyz
+    # Faces in axis order (-x, +x, -y, +y, -z, +z); ties go to the first.
+    faces = (
+        lo[0] - buffer, hi[0] + buffer,
+        lo[1] - buffer, hi[1] + buffer,
+        lo[2] - buffer, hi[2] + buffer,
+    )
+    dists = (
+        x - faces[0], faces[1] - x,
+        y - faces[2], faces[3] - y,
+        z - faces[4], faces[5] - z,
+    )
+    best = min(range(6), key=lambda k: dists[k] if dists[k] >= 0 else math.inf)
+    if dists[best] < 0:
+        return [x, y, z], math.inf
 
-    for i in range(3):
-        lo = zone.min_xyz[i] - buffer
-        hi = zone.max_xyz[i] + buffer
+    escaped = [x, y, z]
+    escaped[best // 2] = faces[best]
+    return escaped, dists[best]
 
-        # Distance to the low face (move in -axis direction)
-        d_lo = point[i] - lo
-        if 0 <= d_lo < best_dist:
-            candidate = list(point)
-            candidate[i] = lo
-            best_dist = d_lo
-            best_point = candidate
 
-        # Distance to the high face (move in +axis direction)
-        d_hi = hi - point[i]
-        if 0 <= d_hi < best_dist:
-            candidate = list(point)
-            candidate[i] = hi
-            best_dist = d_hi
-            best_point = candidate
+def _first_violating_zone(
+    point: list[float],
+    zones: list[KeepoutZone],
+    buffer: float,
+) -> KeepoutZone | None:
+    """Return the first zone whose expanded AABB strictly contains *point*."""
+    if len(zones) < _VECTORISE_MIN_ZONES:
+        for zone in zones:
+            if _point_in_expanded_aabb(point, zone, buffer):
+                return zone
+        return None
+
+    import numpy as np
 
-    return best_point, best_dist
+    pt = np.asarray(point, dtype=float)
+    mins = np.array([z.min_xyz for z in zones], dtype=float) - buffer
+    maxs = np.array([z.max_xyz for z in zones], dtype=float) + buffer
+    hits = np.all((pt > mins) & (pt < maxs), axis=1)
+    if not hits.any():
+        return None
+    return zones[int(np.argmax(hits))]
 
 
 def check_keepout(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
@@ -90,44 +116,45 @@ def check_keepout(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
             [],
         )
 
-    for zone in env.keepout_zones:
-        if _point_in_expanded_aabb(target, zone, buffer):
-            escaped, delta = _minimal_escape(target, zone, buffer)
-            measured = {
-                "violating_zone_id": zone.id,
-                "target_xyz": target,
-                "zone_min_xyz": zone.min_xyz,
-                "zone_max_xyz": zone.max_xyz,
-                "safety_buffer_m": buffer,
-                "escape_delta_m": round(delta, 6),
-            }
-
-            fixes: list[CounterfactualFix] = []
-            if spec.allowed_adjustments.can_move_target:
-                fixes.append(
-                    CounterfactualFix(
-                        type=FixType.MOVE_TARGET,
-                        delta=round(delta, 6),
-                        instruction=(
-                            f"Move target {delta:.4f} m to exit keepout zone "
-                            f"'{zone.id}' (including {buffer} m safety buffer)."
-                        ),
-                        proposed_patch={
-                            "projected_target_xyz": list(escaped),
-                        },
-                    )
+    zone = _first_violating_zone(target, env.keepout_zones, buffer)
+    if zone is not None:
+        escaped, delta = _minimal_escape(target, zone, buffer)
+        delta = round(delta, 6)
+        measured = {
+            "violating_zone_id": zone.id,
+            "target_xyz": target,
+            "zone_min_xyz": zone.min_xyz,
+            "zone_max_xyz": zone.max_xyz,
+            "safety_buffer_m": buffer,
+            "escape_delta_m": delta,
+        }
+
+        fixes: list[CounterfactualFix] = []
+        if spec.allowed_adjustments.can_move_target:
+            fixes.append(
+                CounterfactualFix(
+                    type=FixType.MOVE_TARGET,
+                    delta=delta,
+                    instruction=(
+                        f"Move target {delta:.4f} m to exit keepout zone "
+                        f"'{zone.id}' (including {buffer} m safety buffer)."
+                    ),
+                    proposed_patch={
+                        "projected_target_xyz": escaped,
+                    },
                 )
-
-            return (
-                GateResult(
-                    gate_name=GATE_NAME,
-                    status=GateStatus.FAIL,
-                    measured_values=measured,
-                    reason_code="IN_KEEP_OUT_ZONE",
-                ),
-                fixes,
             )
 
+        return (
+            GateResult(
+                gate_name=GATE_NAME,
+                status=GateStatus.FAIL,
+                measured_values=measured,
+                reason_code="IN_KEEP_OUT_ZONE",
+            ),
+            fixes,
+        )
+
     return (
         GateResult(
             gate_name=GATE_NAME,
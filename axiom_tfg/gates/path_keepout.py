@@ -20,6 +20,7 @@ from axiom_tfg.models import (
     FixType,
     GateResult,
     GateStatus,
+    KeepoutZone,
     TaskSpec,
 )
 
@@ -36,6 +37,28 @@ def _interpolate(a: list[float], b: list[float], n: int) -> list[list[float]]:
     return points
 
 
+def _zones_near_segment(
+    a: list[float],
+    b: list[float],
+    zones: list[KeepoutZone],
+    buffer: float,
+) -> list[KeepoutZone]:
+    """Return the zones (in order) whose expanded AABB overlaps the segment's
+    bounding box.
+
+    Every sample lies inside that box, so any other zone cannot contain one;
+    the comparisons are strict to match ``_point_in_expanded_aabb``.
+    """
+    lo = (min(a[0], b[0]), min(a[1], b[1]), min(a[2], b[2]))
+    hi = (max(a[0], b[0]), max(a[1], b[1]), max(a[2], b[2]))
+    return [
+        z for z in zones
+        if z.min_xyz[0] - buffer < hi[0] and lo[0] < z.max_xyz[0] + buffer
+        and z.min_xyz[1] - buffer < hi[1] and lo[1] < z.max_xyz[1] + buffer
+        and z.min_xyz[2] - buffer < hi[2] and lo[2] < z.max_xyz[2] + buffer
+    ]
+
+
 def check_path_keepout(
     spec: TaskSpec,
 ) -> tuple[GateResult, list[CounterfactualFix]] | None:
@@ -48,7 +71,7 @@ def check_path_keepout(
     # Skip when initial pose is origin-default and no waypoints — means
     # the caller didn't specify a meaningful start point.  However, if
     # waypoints are present we always check.
-    if initial == [0.0, 0.0, 0.0] and not spec.transformation.waypoints:
+    if tuple(initial) == (0.0, 0.0, 0.0) and not spec.transformation.waypoints:
         return None
 
     env = spec.environment
@@ -75,12 +98,16 @@ def check_path_keepout(
     for seg_idx in range(len(nodes) - 1):
         seg_start = nodes[seg_idx]
         seg_end = nodes[seg_idx + 1]
+        candidates = _zones_near_segment(seg_start, seg_end, env.keepout_zones, buffer)
+        if not candidates:
+            continue
         samples = _interpolate(seg_start, seg_end, _SAMPLES_PER_SEGMENT)
 
         for pt_idx, point in enumerate(samples):
-            for zone in env.keepout_zones:
+            for zone in candidates:
                 if _point_in_expanded_aabb(point, zone, buffer):
                     escaped, delta = _minimal_escape(point, zone, buffer)
+                    delta = round(delta, 6)
 
                     measured = {
                         "segment_index": seg_idx,
@@ -90,7 +117,7 @@ def check_path_keepout(
                         "zone_min_xyz": zone.min_xyz,
                         "zone_max_xyz": zone.max_xyz,
                         "safety_buffer_m": buffer,
-                        "escape_delta_m": round(delta, 6),
+                        "escape_delta_m": delta,
                     }
 
                     fixes: list[CounterfactualFix] = []
@@ -98,7 +125,7 @@ def check_path_keepout(
                         fixes.append(
                             CounterfactualFix(
                                 type=FixType.MOVE_TARGET,
-                                delta=round(delta, 6),
+                                delta=delta,
                                 instruction=(
                                     f"Path crosses zone '{zone.id}' at "
                                     f"{[round(v, 4) for v in point]}. "
@@ -106,9 +133,7 @@ def check_path_keepout(
                                     f"{[round(v, 6) for v in escaped]}."
                                 ),
                                 proposed_patch={
-                                    "projected_target_xyz": [
-                                        round(v, 6) for v in escaped
-                                    ],
+                                    "projected_target_xyz": escaped,
                                 },
                             )
                         )
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from axiom_tfg.models import (
     CounterfactualFix,
@@ -13,9 +15,67 @@ from axiom_tfg.models import (
 )
 from axiom_tfg.robots import ROBOT_REGISTRY
 
+if TYPE_CHECKING:
+    from axiom_tfg.columnar import TaskSpecColumnar
+
 
 GATE_NAME = "payload"
 
+# Results are assembled from already-validated spec fields, so they are
+# built with model_construct and skip re-validation.
+
+# Enum members resolved once rather than on every result.
+_PASS = GateStatus.PASS
+_FAIL = GateStatus.FAIL
+_FIX_SPLIT = FixType.SPLIT_PAYLOAD
+_FIX_CHANGE = FixType.CHANGE_CONSTRUCTOR
+
+
+# Fix instructions depend only on a few scalars, which repeat across sweep
+# variants that do not vary the mass; float formatting dominates their cost.
+# ``typed`` keeps 5 and 5.0 apart since they render differently.
+@lru_cache(maxsize=1024, typed=True)
+def _split_instruction(
+    mass: float, max_payload: float, split_count: int, split_mass: float
+) -> str:
+    return (
+        f"Object mass {mass} kg exceeds payload limit {max_payload} kg. "
+        f"Split into {split_count} sequential lifts of {split_mass} kg each. "
+        f"Each lift carries a portion to the target. "
+        f"Use mass_kg={split_mass} for each action."
+    )
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _change_constructor_advice(
+    mass: float, max_payload: float, constructor_id: str
+) -> tuple[str, tuple[str, ...]]:
+    """Return the instruction and the names of registry robots that can lift *mass*."""
+    # Find robots in the registry that can handle this payload.
+    capable = sorted(
+        [
+            (name, p.max_payload_kg)
+            for name, p in ROBOT_REGISTRY.items()
+            if p.max_payload_kg >= mass and name != constructor_id
+        ],
+        key=lambda x: x[1],
+    )
+    if capable:
+        suggestions = ", ".join(
+            f"{name} ({cap}kg)" for name, cap in capable
+        )
+        instruction = (
+            f"Object mass {mass} kg exceeds this robot's payload "
+            f"limit of {max_payload} kg. "
+            f"Robots that can handle this: {suggestions}."
+        )
+    else:
+        instruction = (
+            f"Object mass {mass} kg exceeds payload limit "
+            f"{max_payload} kg. No robot in registry can handle this."
+        )
+    return instruction, tuple(name for name, _ in capable)
+
 
 def _compute_staging_positions(
     target_xyz: list[float],
@@ -30,6 +90,7 @@ def _compute_staging_positions(
     positions: list[list[float]] = []
     # Spread staging points in a small arc near the target so they don't overlap.
     tx, ty, tz = target_xyz
+    staging_z = round(max(tz, 0.1), 4)
     for i in range(split_count):
         frac = (i + 1) / split_count
         # Offset each staging point slightly in y so they don't stack.
@@ -37,13 +98,40 @@ def _compute_staging_positions(
         positions.append([
             round(tx * frac * 0.8, 4),
             round(ty * frac + y_offset, 4),
-            round(max(tz, 0.1), 4),
+            staging_z,
         ])
     # Last position is always the actual target.
-    positions[-1] = [round(v, 4) for v in target_xyz]
+    positions[-1] = [round(tx, 4), round(ty, 4), round(tz, 4)]
     return positions
 
 
+def check_payload_batch(
+    cols: TaskSpecColumnar,
+) -> list[tuple[GateResult, list[CounterfactualFix]]]:
+    """Run :func:`check_payload` over a columnar batch of specs.
+
+    The pass/fail mask is one vectorised comparison; only failing specs go
+    through the per-spec fix construction.
+    """
+    passed = (cols.mass <= cols.max_payload).tolist()
+    return [
+        (
+            GateResult.model_construct(
+                gate_name=GATE_NAME,
+                status=_PASS,
+                measured_values={
+                    "mass_kg": spec.substrate.mass_kg,
+                    "max_payload_kg": spec.constructor.max_payload_kg,
+                },
+            ),
+            [],
+        )
+        if ok
+        else check_payload(spec)
+        for spec, ok in zip(cols.specs, passed)
+    ]
+
+
 def check_payload(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
     """Check whether substrate mass is within the constructor's payload limit.
 
@@ -59,16 +147,16 @@ def check_payload(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
 
     if mass <= max_payload:
         return (
-            GateResult(
+            GateResult.model_construct(
                 gate_name=GATE_NAME,
-                status=GateStatus.PASS,
+                status=_PASS,
                 measured_values=measured,
             ),
             [],
         )
 
     # ── FAIL path ──────────────────────────────────────────────────────
-    excess = mass - max_payload
+    excess = round(mass - max_payload, 6)
     fixes: list[CounterfactualFix] = []
     adj = spec.allowed_adjustments
 
@@ -79,15 +167,10 @@ def check_payload(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
         staging = _compute_staging_positions(target_xyz, split_count)
 
         fixes.append(
-            CounterfactualFix(
-                type=FixType.SPLIT_PAYLOAD,
-                delta=round(excess, 6),
-                instruction=(
-                    f"Object mass {mass} kg exceeds payload limit {max_payload} kg. "
-                    f"Split into {split_count} sequential lifts of {split_mass} kg each. "
-                    f"Each lift carries a portion to the target. "
-                    f"Use mass_kg={split_mass} for each action."
-                ),
+            CounterfactualFix.model_construct(
+                type=_FIX_SPLIT,
+                delta=excess,
+                instruction=_split_instruction(mass, max_payload, split_count, split_mass),
                 proposed_patch={
                     "suggested_payload_split_count": split_count,
                     "split_mass_kg": split_mass,
@@ -97,44 +180,24 @@ def check_payload(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
         )
 
     if adj.can_change_constructor:
-        # Find robots in the registry that can handle this payload.
-        capable = sorted(
-            [
-                (name, p.max_payload_kg)
-                for name, p in ROBOT_REGISTRY.items()
-                if p.max_payload_kg >= mass and name != spec.constructor.id
-            ],
-            key=lambda x: x[1],
+        instruction, capable = _change_constructor_advice(
+            mass, max_payload, spec.constructor.id
         )
-        if capable:
-            suggestions = ", ".join(
-                f"{name} ({cap}kg)" for name, cap in capable
-            )
-            instruction = (
-                f"Object mass {mass} kg exceeds this robot's payload "
-                f"limit of {max_payload} kg. "
-                f"Robots that can handle this: {suggestions}."
-            )
-        else:
-            instruction = (
-                f"Object mass {mass} kg exceeds payload limit "
-                f"{max_payload} kg. No robot in registry can handle this."
-            )
         fixes.append(
-            CounterfactualFix(
-                type=FixType.CHANGE_CONSTRUCTOR,
-                delta=round(excess, 6),
+            CounterfactualFix.model_construct(
+                type=_FIX_CHANGE,
+                delta=excess,
                 instruction=instruction,
                 proposed_patch={
-                    "capable_robots": [name for name, _ in capable],
+                    "capable_robots": list(capable),
                 } if capable else None,
             )
         )
 
     return (
-        GateResult(
+        GateResult.model_construct(
             gate_name=GATE_NAME,
-            status=GateStatus.FAIL,
+            status=_FAIL,
             measured_values=measured,
             reason_code="OVER_PAYLOAD",
         ),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from axiom_tfg.models import (
     CounterfactualFix,
     FixType,
@@ -11,9 +13,26 @@ from axiom_tfg.models import (
 )
 from axiom_tfg.utils import euclidean_distance, point_toward, project_onto_sphere
 
+if TYPE_CHECKING:
+    from axiom_tfg.columnar import TaskSpecColumnar
+
 
 GATE_NAME = "reachability"
 
+# Results are assembled from already-validated spec fields, so they are
+# built with model_construct and skip re-validation.
+
+# Enum members resolved once rather than on every result.
+_PASS = GateStatus.PASS
+_FAIL = GateStatus.FAIL
+_FIX_MOVE_TARGET = FixType.MOVE_TARGET
+_FIX_MOVE_BASE = FixType.MOVE_BASE
+_FIX_CHANGE = FixType.CHANGE_CONSTRUCTOR
+
+# The vectorised norm can differ from math.dist in the last few ulps, so the
+# batch path only decides rows at least this far (relatively) inside the sphere.
+_BOUNDARY_RTOL = 1e-9
+
 
 def check_reachability(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualFix]]:
     """Check whether the target pose is within reach of the constructor.
@@ -21,22 +40,62 @@ def check_reachability(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualF
     Returns a (GateResult, fixes) tuple.  *fixes* is non-empty only when the
     gate fails and allowed_adjustments permit a counterfactual remedy.
     """
+    distance = euclidean_distance(
+        spec.constructor.base_pose.xyz, spec.transformation.target_pose.xyz
+    )
+    return _reachability_result(spec, distance, distance <= spec.constructor.max_reach_m)
+
+
+def check_reachability_batch(
+    cols: TaskSpecColumnar,
+) -> list[tuple[GateResult, list[CounterfactualFix]]]:
+    """Run :func:`check_reachability` over a columnar batch of specs.
+
+    Distances for all rows are computed in one vectorised pass.  Failing and
+    near-boundary rows go through :func:`check_reachability` itself, so
+    verdicts and fixes always match the per-spec gate.
+    """
+    import numpy as np
+
+    diff = cols.targets - cols.bases
+    distances = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    clear = distances < cols.max_reach * (1.0 - _BOUNDARY_RTOL)
+
+    return [
+        (
+            GateResult.model_construct(
+                gate_name=GATE_NAME,
+                status=_PASS,
+                measured_values={
+                    "distance_m": round(d, 6),
+                    "max_reach_m": spec.constructor.max_reach_m,
+                },
+            ),
+            [],
+        )
+        if ok
+        else check_reachability(spec)
+        for spec, d, ok in zip(cols.specs, distances.tolist(), clear.tolist())
+    ]
+
+
+def _reachability_result(
+    spec: TaskSpec, distance: float, passed: bool
+) -> tuple[GateResult, list[CounterfactualFix]]:
     base = spec.constructor.base_pose.xyz
     target = spec.transformation.target_pose.xyz
     max_reach = spec.constructor.max_reach_m
 
-    distance = euclidean_distance(base, target)
-
     measured = {
         "distance_m": round(distance, 6),
         "max_reach_m": max_reach,
     }
 
-    if distance <= max_reach:
+    if passed:
         return (
-            GateResult(
+            GateResult.model_construct(
                 gate_name=GATE_NAME,
-                status=GateStatus.PASS,
+                status=_PASS,
                 measured_values=measured,
             ),
             [],
@@ -44,45 +103,46 @@ def check_reachability(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualF
 
     # ── FAIL path ──────────────────────────────────────────────────────
     overshoot = distance - max_reach
+    overshoot_r = round(overshoot, 6)
     fixes: list[CounterfactualFix] = []
     adj = spec.allowed_adjustments
 
     if adj.can_move_target:
-        projected = project_onto_sphere(base, target, max_reach)
+        px, py, pz = project_onto_sphere(base, target, max_reach)
         fixes.append(
-            CounterfactualFix(
-                type=FixType.MOVE_TARGET,
-                delta=round(overshoot, 6),
+            CounterfactualFix.model_construct(
+                type=_FIX_MOVE_TARGET,
+                delta=overshoot_r,
                 instruction=(
                     f"Move target {overshoot:.4f} m closer to base "
                     f"(projected onto reach sphere)."
                 ),
                 proposed_patch={
-                    "projected_target_xyz": [round(v, 6) for v in projected],
+                    "projected_target_xyz": [round(px, 6), round(py, 6), round(pz, 6)],
                 },
             )
         )
 
     if adj.can_move_base:
-        new_base = point_toward(base, target, overshoot)
+        bx, by, bz = point_toward(base, target, overshoot)
         fixes.append(
-            CounterfactualFix(
-                type=FixType.MOVE_BASE,
-                delta=round(overshoot, 6),
+            CounterfactualFix.model_construct(
+                type=_FIX_MOVE_BASE,
+                delta=overshoot_r,
                 instruction=(
                     f"Move constructor base {overshoot:.4f} m toward target."
                 ),
                 proposed_patch={
-                    "suggested_base_xyz": [round(v, 6) for v in new_base],
+                    "suggested_base_xyz": [round(bx, 6), round(by, 6), round(bz, 6)],
                 },
             )
         )
 
     if adj.can_change_constructor:
         fixes.append(
-            CounterfactualFix(
-                type=FixType.CHANGE_CONSTRUCTOR,
-                delta=round(overshoot, 6),
+            CounterfactualFix.model_construct(
+                type=_FIX_CHANGE,
+                delta=overshoot_r,
                 instruction=(
                     f"Replace constructor with one whose max_reach_m >= {distance:.4f} m."
                 ),
@@ -90,9 +150,9 @@ def check_reachability(spec: TaskSpec) -> tuple[GateResult, list[CounterfactualF
         )
 
     return (
-        GateResult(
+        GateResult.model_construct(
             gate_name=GATE_NAME,
-            status=GateStatus.FAIL,
+            status=_FAIL,
             measured_values=measured,
             reason_code="OUT_OF_REACH",
         ),
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import math
-import uuid
+import secrets
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -35,7 +35,7 @@ class FixType(str, Enum):
 
 class XYZ(BaseModel):
     """A 3-D coordinate."""
-    xyz: list[float] = Field(min_length=3, max_length=3)
+    xyz: tuple[float, float, float]
 
 
 class SubstrateSpec(BaseModel):
@@ -102,8 +102,8 @@ class AllowedAdjustments(BaseModel):
 class KeepoutZone(BaseModel):
     """Axis-aligned bounding box defining a forbidden volume."""
     id: str
-    min_xyz: list[float] = Field(min_length=3, max_length=3)
-    max_xyz: list[float] = Field(min_length=3, max_length=3)
+    min_xyz: tuple[float, float, float]
+    max_xyz: tuple[float, float, float]
 
 
 class EnvironmentSpec(BaseModel):
@@ -117,7 +117,7 @@ class MetaSpec(BaseModel):
 
 class TaskSpec(BaseModel):
     """Root schema for a physical-task YAML file."""
-    task_id: str = Field(default_factory=lambda: uuid.uuid4().hex[:12])
+    task_id: str = Field(default_factory=lambda: secrets.token_hex(6))
     meta: MetaSpec
     substrate: SubstrateSpec
     transformation: TransformationSpec
@@ -147,6 +147,11 @@ class CounterfactualFix(BaseModel):
     proposed_patch: dict[str, Any] | None = None
 
 
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string with millisecond precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
 class EvidencePacket(BaseModel):
     task_id: str
     verdict: Verdict
@@ -154,7 +159,5 @@ class EvidencePacket(BaseModel):
     checks: list[GateResult] = Field(default_factory=list)
     counterfactual_fixes: list[CounterfactualFix] = Field(default_factory=list)
     validation_level_reached: str | None = None
-    created_at: str = Field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(),
-    )
+    created_at: str = Field(default_factory=now_iso)
     axiom_tfg_version: str = "0.1.0"
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from axiom_tfg.evidence import run_gates
+from axiom_tfg.evidence import run_gates, write_evidence_file
 from axiom_tfg.models import EvidencePacket, TaskSpec
+from axiom_tfg.utils import load_yaml, write_json
 
 
 def run_taskspec(spec: TaskSpec) -> tuple[dict[str, Any], EvidencePacket]:
@@ -46,7 +46,7 @@ def load_and_run(path: Path) -> tuple[dict[str, Any], EvidencePacket, TaskSpec]:
     Returns (result_dict, evidence_packet, spec).
     """
     with open(path, "r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh)
+        raw = load_yaml(fh)
     spec = TaskSpec.model_validate(raw)
     result, packet = run_taskspec(spec)
     return result, packet, spec
@@ -78,16 +78,10 @@ def write_artifact_bundle(
 
     # result.json (without the nested evidence blob)
     result_slim = {k: v for k, v in result.items() if k != "evidence"}
-    (out_dir / "result.json").write_text(
-        json.dumps(result_slim, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    write_json(out_dir / "result.json", result_slim)
 
     # evidence.json
-    (out_dir / "evidence.json").write_text(
-        json.dumps(packet.model_dump(mode="json"), indent=2) + "\n",
-        encoding="utf-8",
-    )
+    write_evidence_file(packet, out_dir / "evidence.json")
 
     if junit:
         xml = _junit_single(spec.task_id, packet)
@@ -3,11 +3,25 @@
 from __future__ import annotations
 
 import math
+from pathlib import Path
+from typing import Any
+
+import orjson
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Indented, newline-terminated, and tolerant of numpy scalars/arrays that
+# gate code may put into measured values.
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
 
 
 def euclidean_distance(a: list[float], b: list[float]) -> float:
     """Euclidean distance between two 3-D points."""
-    return math.sqrt(sum((ai - bi) ** 2 for ai, bi in zip(a, b)))
+    return math.dist(a, b)
 
 
 def project_onto_sphere(
@@ -21,11 +35,14 @@ def project_onto_sphere(
     center to target.  If center == target the original target is returned
     unchanged (degenerate case).
     """
-    dist = euclidean_distance(center, target)
-    if dist == 0.0:
+    dx = target[0] - center[0]
+    dy = target[1] - center[1]
+    dz = target[2] - center[2]
+    d2 = dx * dx + dy * dy + dz * dz
+    if d2 == 0.0:
         return list(target)
-    scale = radius / dist
-    return [c + (t - c) * scale for c, t in zip(center, target)]
+    scale = radius / math.sqrt(d2)
+    return [center[0] + dx * scale, center[1] + dy * scale, center[2] + dz * scale]
 
 
 def point_toward(
@@ -34,8 +51,26 @@ def point_toward(
     step: float,
 ) -> list[float]:
     """Move *source* toward *destination* by *step* metres."""
-    dist = euclidean_distance(source, destination)
-    if dist == 0.0:
+    dx = destination[0] - source[0]
+    dy = destination[1] - source[1]
+    dz = destination[2] - source[2]
+    d2 = dx * dx + dy * dy + dz * dz
+    if d2 == 0.0:
         return list(source)
-    scale = step / dist
-    return [s + (d - s) * scale for s, d in zip(source, destination)]
+    scale = step / math.sqrt(d2)
+    return [source[0] + dx * scale, source[1] + dy * scale, source[2] + dz * scale]
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, using libyaml when available."""
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """Serialise *obj* to indented JSON bytes with a trailing newline."""
+    return orjson.dumps(obj, option=_JSON_OPTIONS)
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Write *obj* to *path* as indented JSON (see :func:`dump_json_bytes`)."""
+    path.write_bytes(dump_json_bytes(obj))
@@ -0,0 +1,31 @@
+"""Shared fixtures for the API tests: one temp data dir and one TestClient."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+# Point data dir to a temp location before importing the app.
+_tmpdir = tempfile.mkdtemp()
+os.environ.setdefault("AXIOM_DATA_DIR", _tmpdir)
+
+import axiom_server.app as app_module  # noqa: E402
+
+app_module.DATA_DIR = Path(_tmpdir)
+app_module.RUNS_DIR = Path(_tmpdir) / "runs"
+app_module.SWEEPS_DIR = Path(_tmpdir) / "sweeps"
+app_module.store = app_module.RunStore(Path(_tmpdir) / "axiom.db")
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """A TestClient shared by every test; the app's lifespan runs once around it."""
+    with TestClient(app_module.app) as c:
+        yield c
+    shutil.rmtree(_tmpdir, ignore_errors=True)
@@ -4,27 +4,13 @@ from __future__ import annotations
 
 import json
 import os
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import weakref
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-# Point data dir to a temp location before importing the app.
-_tmpdir = tempfile.mkdtemp()
-os.environ.setdefault("AXIOM_DATA_DIR", _tmpdir)
-
-import axiom_server.app as app_module  # noqa: E402
-
-app_module.DATA_DIR = Path(_tmpdir)
-app_module.RUNS_DIR = Path(_tmpdir) / "runs"
-app_module.SWEEPS_DIR = Path(_tmpdir) / "sweeps"
-app_module.store = app_module.RunStore(Path(_tmpdir) / "axiom.db")
-
-from axiom_server.app import app  # noqa: E402
-
-client = TestClient(app)
+import axiom_server.app as app_module
 
 _FAKE_YAML = """\
 task_id: generated-001
@@ -72,6 +58,25 @@ _SAMPLE_EVIDENCE = {
 }
 
 
+@pytest.fixture(autouse=True)
+def _clear_ai_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each test sees cold caches and fresh, non-sleeping upstream limits."""
+    app_module.ai.clear_response_cache()
+    app_module.ai.clear_status_cache()
+    monkeypatch.setattr(app_module.ai, "_provider_limits", weakref.WeakKeyDictionary())
+    monkeypatch.setattr(app_module.ai, "_RETRY_BASE_DELAY_S", 0.0)
+
+
+@pytest.fixture
+def gemini_model(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """A fake Gemini model served by ``ai._get_model``, with a key configured."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "fake-key")
+    model = MagicMock()
+    model.generate_content_async = AsyncMock()
+    monkeypatch.setattr(app_module.ai, "_get_model", MagicMock(return_value=model))
+    return model
+
+
 def _mock_response(text: str) -> MagicMock:
     """Create a mock Gemini response object."""
     resp = MagicMock()
@@ -82,12 +87,8 @@ def _mock_response(text: str) -> MagicMock:
 # ── POST /ai/generate ────────────────────────────────────────────────────
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_returns_yaml(mock_get_model: MagicMock) -> None:
-    model = MagicMock()
-    model.generate_content.return_value = _mock_response(_FAKE_YAML)
-    mock_get_model.return_value = model
+def test_ai_generate_returns_yaml(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.return_value = _mock_response(_FAKE_YAML)
 
     resp = client.post("/ai/generate", json={"prompt": "pick a 2kg box"})
     assert resp.status_code == 200
@@ -96,49 +97,77 @@ def test_ai_generate_returns_yaml(mock_get_model: MagicMock) -> None:
     assert "task_id" in data["yaml"]
     assert data["provider"] == "gemini"
     assert data["model_used"] == "gemini-2.0-flash"
-    model.generate_content.assert_called_once()
+    gemini_model.generate_content_async.assert_called_once()
+    # System prompt is bound to the (cached) model, not resent per request.
+    app_module.ai._get_model.assert_called_once_with("gemini-2.0-flash", app_module.ai._GENERATE_SYSTEM)
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_strips_markdown_fences(mock_get_model: MagicMock) -> None:
+def test_ai_generate_strips_markdown_fences(gemini_model: MagicMock, client: TestClient) -> None:
     fenced = "```yaml\n" + _FAKE_YAML + "\n```"
-    model = MagicMock()
-    model.generate_content.return_value = _mock_response(fenced)
-    mock_get_model.return_value = model
+    gemini_model.generate_content_async.return_value = _mock_response(fenced)
 
     resp = client.post("/ai/generate", json={"prompt": "pick a box"})
     assert resp.status_code == 200
     assert "```" not in resp.json()["yaml"]
 
 
-def test_ai_generate_returns_503_without_key() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env.pop("AXIOM_AI_DEMO_FALLBACK", None)
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.post("/ai/generate", json={"prompt": "hello"})
-        assert resp.status_code == 503
-        assert resp.headers["content-type"].startswith("application/json")
-        assert "GOOGLE_API_KEY" in resp.json()["detail"]
+def test_ai_generate_returns_503_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_AI_DEMO_FALLBACK", raising=False)
+    resp = client.post("/ai/generate", json={"prompt": "hello"})
+    assert resp.status_code == 503
+    assert resp.headers["content-type"].startswith("application/json")
+    assert "GOOGLE_API_KEY" in resp.json()["detail"]
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ai_generate_rejects_empty_prompt() -> None:
+def test_ai_generate_rejects_empty_prompt(client: TestClient) -> None:
     resp = client.post("/ai/generate", json={"prompt": ""})
     assert resp.status_code == 400
     assert resp.headers["content-type"].startswith("application/json")
 
 
-# ── POST /ai/explain ─────────────────────────────────────────────────────
+def test_ai_generate_caches_identical_requests(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.return_value = _mock_response(_FAKE_YAML)
+
+    first = client.post("/ai/generate", json={"prompt": "pick a box"})
+    second = client.post("/ai/generate", json={"prompt": "pick a box"})
+    assert first.json() == second.json()
+    gemini_model.generate_content_async.assert_called_once()
+
+    client.post("/ai/generate", json={"prompt": "pick a box", "model": "gemini-1.5-flash"})
+    assert gemini_model.generate_content_async.call_count == 2
+
+
+# ── POST /ai/generate/batch ──────────────────────────────────────────────
+
+
+def test_ai_generate_batch_preserves_order(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.side_effect = [
+        _mock_response("task_id: a"),
+        _mock_response("task_id: b"),
+    ]
+
+    resp = client.post("/ai/generate/batch", json={"prompts": ["first", "second"]})
+    assert resp.status_code == 200
+    results = resp.json()["results"]
+    assert [r["yaml"] for r in results] == ["task_id: a", "task_id: b"]
+    assert gemini_model.generate_content_async.call_count == 2
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_explain_returns_explanation(mock_get_model: MagicMock) -> None:
-    model = MagicMock()
-    model.generate_content.return_value = _mock_response(_FAKE_EXPLANATION)
-    mock_get_model.return_value = model
+def test_ai_generate_batch_rejects_empty_prompts(client: TestClient) -> None:
+    resp = client.post("/ai/generate/batch", json={"prompts": []})
+    assert resp.status_code == 400
+    resp = client.post("/ai/generate/batch", json={"prompts": ["ok", ""]})
+    assert resp.status_code == 400
+
+
+# ── POST /ai/explain ─────────────────────────────────────────────────────
+
+
+def test_ai_explain_returns_explanation(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.return_value = _mock_response(_FAKE_EXPLANATION)
 
     resp = client.post("/ai/explain", json={"evidence": _SAMPLE_EVIDENCE})
     assert resp.status_code == 200
@@ -146,22 +175,20 @@ def test_ai_explain_returns_explanation(mock_get_model: MagicMock) -> None:
     assert "explanation" in data
     assert len(data["explanation"]) > 0
     assert data["provider"] == "gemini"
-    model.generate_content.assert_called_once()
+    gemini_model.generate_content_async.assert_called_once()
 
 
-def test_ai_explain_returns_503_without_key() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env.pop("AXIOM_AI_DEMO_FALLBACK", None)
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.post("/ai/explain", json={"evidence": _SAMPLE_EVIDENCE})
-        assert resp.status_code == 503
-        assert resp.headers["content-type"].startswith("application/json")
-        assert "GOOGLE_API_KEY" in resp.json()["detail"]
+def test_ai_explain_returns_503_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_AI_DEMO_FALLBACK", raising=False)
+    resp = client.post("/ai/explain", json={"evidence": _SAMPLE_EVIDENCE})
+    assert resp.status_code == 503
+    assert resp.headers["content-type"].startswith("application/json")
+    assert "GOOGLE_API_KEY" in resp.json()["detail"]
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ai_explain_rejects_empty_evidence() -> None:
+def test_ai_explain_rejects_empty_evidence(client: TestClient) -> None:
     resp = client.post("/ai/explain", json={"evidence": None})
     assert resp.status_code == 400
 
@@ -169,7 +196,7 @@ def test_ai_explain_rejects_empty_evidence() -> None:
 # ── GET /ai/models ────────────────────────────────────────────────────────
 
 
-def test_ai_models_returns_default_and_list() -> None:
+def test_ai_models_returns_default_and_list(client: TestClient) -> None:
     resp = client.get("/ai/models")
     assert resp.status_code == 200
     data = resp.json()
@@ -181,10 +208,16 @@ def test_ai_models_returns_default_and_list() -> None:
     assert data["default"] in data["models"]
 
 
+@patch.dict(os.environ, {"AXIOM_GEMINI_MODELS_ALLOWLIST": " gemini-x, ,gemini-y "})
+def test_ai_models_honours_allowlist_env(client: TestClient) -> None:
+    resp = client.get("/ai/models")
+    assert resp.json()["models"] == ["gemini-x", "gemini-y"]
+
+
 # ── GET /ai/status ────────────────────────────────────────────────────────
 
 
-def test_ai_status_has_full_fields() -> None:
+def test_ai_status_has_full_fields(client: TestClient) -> None:
     resp = client.get("/ai/status")
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("application/json")
@@ -196,36 +229,57 @@ def test_ai_status_has_full_fields() -> None:
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ai_status_enabled_with_key() -> None:
+def test_ai_status_enabled_with_key(client: TestClient) -> None:
     resp = client.get("/ai/status")
     data = resp.json()
     assert data["ai_enabled"] is True
     assert data["provider"] == "gemini"
 
 
-def test_ai_status_disabled_without_key() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env.pop("AXIOM_AI_DEMO_FALLBACK", None)
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.get("/ai/status")
-        data = resp.json()
-        assert data["ai_enabled"] is False
-        assert "reason" in data
+def test_ai_status_disabled_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_AI_DEMO_FALLBACK", raising=False)
+    resp = client.get("/ai/status")
+    data = resp.json()
+    assert data["ai_enabled"] is False
+    assert "reason" in data
+
+
+def test_ai_status_is_cached_until_cleared() -> None:
+    from axiom_server import ai
+
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"}):
+        assert ai.is_available() is True
+    # Key removed, but the cached status is still within its TTL.
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "", "AXIOM_AI_DEMO_FALLBACK": "false"}):
+        assert ai.is_available() is True
+        ai.clear_status_cache()
+        assert ai.is_available() is False
+
+
+def test_ai_gate_and_generate_share_the_cached_status(
+    gemini_model: MagicMock, client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    gemini_model.generate_content_async.return_value = _mock_response(_FAKE_YAML)
+    assert client.get("/ai/status").json()["ai_enabled"] is True
+
+    # Key removed within the status TTL: the endpoint gate and the generator
+    # read the same snapshot, so the request is served rather than passing
+    # the gate and then failing with 503.
+    monkeypatch.delenv("GOOGLE_API_KEY")
+    resp = client.post("/ai/generate", json={"prompt": "pick a box"})
+    assert resp.status_code == 200
+    assert resp.json()["provider"] == "gemini"
 
 
 # ── 429 error handling ────────────────────────────────────────────────────
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_returns_429_on_quota_error(mock_get_model: MagicMock) -> None:
+def test_ai_generate_returns_429_on_quota_error(gemini_model: MagicMock, client: TestClient) -> None:
     """When Gemini raises ResourceExhausted and fallback is off, return 429 JSON."""
     # Create an exception class that looks like ResourceExhausted.
     exc = type("ResourceExhausted", (Exception,), {})("quota exceeded")
-    model = MagicMock()
-    model.generate_content.side_effect = exc
-    mock_get_model.return_value = model
+    gemini_model.generate_content_async.side_effect = exc
 
     resp = client.post("/ai/generate", json={"prompt": "pick a box"})
     assert resp.status_code == 429
@@ -233,12 +287,17 @@ def test_ai_generate_returns_429_on_quota_error(mock_get_model: MagicMock) -> No
     assert "quota" in resp.json()["detail"].lower()
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_returns_502_on_unknown_error(mock_get_model: MagicMock) -> None:
-    model = MagicMock()
-    model.generate_content.side_effect = RuntimeError("some upstream issue")
-    mock_get_model.return_value = model
+def test_ai_generate_retries_quota_errors(gemini_model: MagicMock, client: TestClient) -> None:
+    exc = type("ResourceExhausted", (Exception,), {})("quota exceeded")
+    gemini_model.generate_content_async.side_effect = [exc, _mock_response(_FAKE_YAML)]
+
+    resp = client.post("/ai/generate", json={"prompt": "pick a box"})
+    assert resp.status_code == 200
+    assert gemini_model.generate_content_async.call_count == 2
+
+
+def test_ai_generate_returns_502_on_unknown_error(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.side_effect = RuntimeError("some upstream issue")
 
     resp = client.post("/ai/generate", json={"prompt": "pick a box"})
     assert resp.status_code == 502
@@ -249,14 +308,11 @@ def test_ai_generate_returns_502_on_unknown_error(mock_get_model: MagicMock) ->
 # ── Fallback provider ────────────────────────────────────────────────────
 
 
-@patch.dict(os.environ, {"AXIOM_AI_DEMO_FALLBACK": "true"})
-def test_ai_generate_fallback_without_key() -> None:
+def test_ai_generate_fallback_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """With fallback enabled and no key, generate returns valid YAML via fallback."""
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env["AXIOM_AI_DEMO_FALLBACK"] = "true"
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.post("/ai/generate", json={"prompt": "pick a 3kg box with franka"})
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.setenv("AXIOM_AI_DEMO_FALLBACK", "true")
+    resp = client.post("/ai/generate", json={"prompt": "pick a 3kg box with franka"})
     assert resp.status_code == 200
     data = resp.json()
     assert data["provider"] == "fallback"
@@ -266,14 +322,11 @@ def test_ai_generate_fallback_without_key() -> None:
     assert "franka" in data["yaml"]
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key", "AXIOM_AI_DEMO_FALLBACK": "true"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_falls_back_on_quota_error(mock_get_model: MagicMock) -> None:
+@patch.dict(os.environ, {"AXIOM_AI_DEMO_FALLBACK": "true"})
+def test_ai_generate_falls_back_on_quota_error(gemini_model: MagicMock, client: TestClient) -> None:
     """With fallback enabled, quota error triggers fallback instead of 429."""
     exc = type("ResourceExhausted", (Exception,), {})("quota exceeded")
-    model = MagicMock()
-    model.generate_content.side_effect = exc
-    mock_get_model.return_value = model
+    gemini_model.generate_content_async.side_effect = exc
 
     resp = client.post("/ai/generate", json={"prompt": "pick a box"})
     assert resp.status_code == 200
@@ -282,13 +335,10 @@ def test_ai_generate_falls_back_on_quota_error(mock_get_model: MagicMock) -> Non
     assert "task_id" in data["yaml"]
 
 
-@patch.dict(os.environ, {"AXIOM_AI_DEMO_FALLBACK": "true"})
-def test_ai_explain_fallback() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env["AXIOM_AI_DEMO_FALLBACK"] = "true"
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.post("/ai/explain", json={"evidence": _SAMPLE_EVIDENCE})
+def test_ai_explain_fallback(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.setenv("AXIOM_AI_DEMO_FALLBACK", "true")
+    resp = client.post("/ai/explain", json={"evidence": _SAMPLE_EVIDENCE})
     assert resp.status_code == 200
     data = resp.json()
     assert data["provider"] == "fallback"
@@ -300,13 +350,14 @@ def test_ai_explain_fallback() -> None:
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
 @patch("axiom_server.ai._get_openai_client")
-def test_openai_generate_returns_yaml(mock_client_fn: MagicMock) -> None:
+def test_openai_generate_returns_yaml(mock_client_fn: MagicMock, client: TestClient) -> None:
     """OpenAI provider generates YAML via chat completions."""
     mock_choice = MagicMock()
     mock_choice.message.content = _FAKE_YAML
     mock_resp = MagicMock()
     mock_resp.choices = [mock_choice]
     mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
     mock_client.chat.completions.create.return_value = mock_resp
     mock_client_fn.return_value = mock_client
 
@@ -322,13 +373,14 @@ def test_openai_generate_returns_yaml(mock_client_fn: MagicMock) -> None:
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
 @patch("axiom_server.ai._get_openai_client")
-def test_openai_explain_returns_explanation(mock_client_fn: MagicMock) -> None:
+def test_openai_explain_returns_explanation(mock_client_fn: MagicMock, client: TestClient) -> None:
     """OpenAI provider explains evidence via chat completions."""
     mock_choice = MagicMock()
     mock_choice.message.content = _FAKE_EXPLANATION
     mock_resp = MagicMock()
     mock_resp.choices = [mock_choice]
     mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
     mock_client.chat.completions.create.return_value = mock_resp
     mock_client_fn.return_value = mock_client
 
@@ -342,10 +394,11 @@ def test_openai_explain_returns_explanation(mock_client_fn: MagicMock) -> None:
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
 @patch("axiom_server.ai._get_openai_client")
-def test_openai_generate_returns_429_on_rate_limit(mock_client_fn: MagicMock) -> None:
+def test_openai_generate_returns_429_on_rate_limit(mock_client_fn: MagicMock, client: TestClient) -> None:
     """When Groq raises RateLimitError and fallback is off, return 429."""
     exc = type("RateLimitError", (Exception,), {})("rate limited")
     mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock()
     mock_client.chat.completions.create.side_effect = exc
     mock_client_fn.return_value = mock_client
 
@@ -354,21 +407,19 @@ def test_openai_generate_returns_429_on_rate_limit(mock_client_fn: MagicMock) ->
     assert "quota" in resp.json()["detail"].lower()
 
 
-def test_openai_generate_returns_503_without_key() -> None:
+def test_openai_generate_returns_503_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """When provider is openai but no key is set, return 503."""
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env.pop("AXIOM_OPENAI_API_KEY", None)
-    env.pop("AXIOM_AI_DEMO_FALLBACK", None)
-    env["AXIOM_AI_PROVIDER"] = "openai"
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.post("/ai/generate", json={"prompt": "hello"})
-        assert resp.status_code == 503
-        assert "AXIOM_OPENAI_API_KEY" in resp.json()["detail"]
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_AI_DEMO_FALLBACK", raising=False)
+    monkeypatch.setenv("AXIOM_AI_PROVIDER", "openai")
+    resp = client.post("/ai/generate", json={"prompt": "hello"})
+    assert resp.status_code == 503
+    assert "AXIOM_OPENAI_API_KEY" in resp.json()["detail"]
 
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
-def test_openai_models_returns_groq_defaults() -> None:
+def test_openai_models_returns_groq_defaults(client: TestClient) -> None:
     """GET /ai/models with openai provider returns Groq model list."""
     resp = client.get("/ai/models")
     data = resp.json()
@@ -378,7 +429,7 @@ def test_openai_models_returns_groq_defaults() -> None:
 
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
-def test_openai_status_shows_base_url() -> None:
+def test_openai_status_shows_base_url(client: TestClient) -> None:
     """GET /ai/status with openai provider includes base_url."""
     resp = client.get("/ai/status")
     data = resp.json()
@@ -388,7 +439,7 @@ def test_openai_status_shows_base_url() -> None:
 
 
 @patch.dict(os.environ, {"AXIOM_AI_PROVIDER": "openai", "AXIOM_OPENAI_API_KEY": "fake-groq-key"})
-def test_openai_generate_rejects_bad_model() -> None:
+def test_openai_generate_rejects_bad_model(client: TestClient) -> None:
     """Model not in openai allowlist returns 400."""
     resp = client.post("/ai/generate", json={"prompt": "hello", "model": "gpt-4"})
     assert resp.status_code == 400
@@ -399,18 +450,14 @@ def test_openai_generate_rejects_bad_model() -> None:
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ai_generate_rejects_bad_model() -> None:
+def test_ai_generate_rejects_bad_model(client: TestClient) -> None:
     resp = client.post("/ai/generate", json={"prompt": "hello", "model": "gpt-4"})
     assert resp.status_code == 400
     assert "allowlist" in resp.json()["detail"]
 
 
-@patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-@patch("axiom_server.ai._get_model")
-def test_ai_generate_accepts_allowlisted_model(mock_get_model: MagicMock) -> None:
-    model = MagicMock()
-    model.generate_content.return_value = _mock_response(_FAKE_YAML)
-    mock_get_model.return_value = model
+def test_ai_generate_accepts_allowlisted_model(gemini_model: MagicMock, client: TestClient) -> None:
+    gemini_model.generate_content_async.return_value = _mock_response(_FAKE_YAML)
 
     resp = client.post("/ai/generate", json={"prompt": "pick a box", "model": "gemini-1.5-flash"})
     assert resp.status_code == 200
@@ -420,7 +467,7 @@ def test_ai_generate_accepts_allowlisted_model(mock_get_model: MagicMock) -> Non
 # ── UI rendering ──────────────────────────────────────────────────────────
 
 
-def test_ui_prompt_mode_elements_present() -> None:
+def test_ui_prompt_mode_elements_present(client: TestClient) -> None:
     """GET / always contains Prompt Mode elements."""
     resp = client.get("/")
     assert resp.status_code == 200
@@ -428,22 +475,20 @@ def test_ui_prompt_mode_elements_present() -> None:
     assert 'id="generateRunBtn"' in resp.text
 
 
-def test_ui_hides_ai_when_key_missing() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env.pop("AXIOM_AI_DEMO_FALLBACK", None)
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.get("/")
-        assert resp.status_code == 200
-        assert 'id="promptInput"' in resp.text
-        assert 'id="generateRunBtn"' in resp.text
-        assert "disabled" in resp.text  # prompt + button disabled
-        assert "AI disabled" in resp.text
-        assert "AI_ENABLED = false" in resp.text
+def test_ui_hides_ai_when_key_missing(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.delenv("AXIOM_AI_DEMO_FALLBACK", raising=False)
+    resp = client.get("/")
+    assert resp.status_code == 200
+    assert 'id="promptInput"' in resp.text
+    assert 'id="generateRunBtn"' in resp.text
+    assert "disabled" in resp.text  # prompt + button disabled
+    assert "AI disabled" in resp.text
+    assert "AI_ENABLED = false" in resp.text
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ui_shows_ai_when_key_present() -> None:
+def test_ui_shows_ai_when_key_present(client: TestClient) -> None:
     resp = client.get("/")
     assert resp.status_code == 200
     assert 'id="promptInput"' in resp.text
@@ -452,15 +497,118 @@ def test_ui_shows_ai_when_key_present() -> None:
     assert 'id="ai-model-select"' in resp.text
 
 
-def test_ui_shows_ai_when_fallback_enabled() -> None:
+def test_ui_shows_ai_when_fallback_enabled(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     """Even without a key, if fallback is on the AI panel should render."""
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    env["AXIOM_AI_DEMO_FALLBACK"] = "true"
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.get("/")
-        assert resp.status_code == 200
-        assert 'id="generateRunBtn"' in resp.text
-        assert 'id="ai-model-select"' in resp.text
-        assert "AI_ENABLED = true" in resp.text
-        assert "Demo fallback mode" in resp.text
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.setenv("AXIOM_AI_DEMO_FALLBACK", "true")
+    resp = client.get("/")
+    assert resp.status_code == 200
+    assert 'id="generateRunBtn"' in resp.text
+    assert 'id="ai-model-select"' in resp.text
+    assert "AI_ENABLED = true" in resp.text
+    assert "Demo fallback mode" in resp.text
+
+
+# ── Fallback keyword matching ────────────────────────────────────────────
+
+
+def test_fallback_generate_picks_keywords_by_priority() -> None:
+    from axiom_server.ai import _fallback_generate
+
+    text = _fallback_generate("put the bottle near the box using ur10e, 1.5 kg")
+    assert "  id: box" in text  # "box" outranks "bottle"
+    assert "  id: ur10e" in text
+    assert "mass_kg: 1.5" in text
+
+    text = _fallback_generate("nothing recognisable here")
+    assert "  id: object" in text
+    assert "  id: ur5e" in text
+
+
+# ── Shared upstream HTTP client ──────────────────────────────────────────
+
+
+def test_openai_clients_share_one_http_pool() -> None:
+    import asyncio
+
+    from axiom_server import ai
+
+    a = ai._build_openai_client("key-a", "https://a.example/v1")
+    b = ai._build_openai_client("key-b", "https://b.example/v1")
+    assert a._client is b._client is ai._get_http_client()
+
+    asyncio.run(ai.aclose())
+    assert ai._http_client is None
+
+
+# ── Upstream throttling ──────────────────────────────────────────────────
+
+
+def test_provider_limits_work_across_event_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    from axiom_server import ai
+
+    monkeypatch.setenv("AXIOM_AI_MAX_CONCURRENCY", "1")
+
+    async def upstream() -> str:
+        await asyncio.sleep(0)
+        return "ok"
+
+    async def burst() -> list[str]:
+        # Two calls contend for the single slot, so the semaphore has to wait
+        # (and bind to this loop).
+        return await asyncio.gather(*(ai._call_upstream("gemini", upstream) for _ in range(2)))
+
+    assert asyncio.run(burst()) == ["ok", "ok"]
+    assert asyncio.run(burst()) == ["ok", "ok"]
+
+
+def test_provider_rpm_limit_is_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    from axiom_server import ai
+
+    async def limiter() -> ai._RateLimiter | None:
+        return ai._get_provider_limits("gemini")[1]
+
+    monkeypatch.delenv("AXIOM_AI_RPM", raising=False)
+    assert asyncio.run(limiter()) is None
+
+    monkeypatch.setenv("AXIOM_AI_RPM", "60")
+    rate_limiter = asyncio.run(limiter())
+    assert rate_limiter is not None and rate_limiter.rate == 60
+
+
+# ── Upstream exception mapping ───────────────────────────────────────────
+
+
+def test_map_upstream_exception_matches_class_and_subclasses() -> None:
+    from axiom_server.ai import _map_upstream_exception
+
+    perm = type("PermissionDeniedError", (Exception,), {})
+    assert _map_upstream_exception(perm()).status_code == 403
+    sub = type("ProjectPermissionDenied", (perm,), {})
+    assert _map_upstream_exception(sub()).status_code == 403
+    assert _map_upstream_exception(ValueError("x")).status_code == 502
+
+
+# ── Module surface ───────────────────────────────────────────────────────
+
+
+def test_generate_taskspec_has_single_dict_returning_definition() -> None:
+    import inspect
+
+    from axiom_server import ai
+
+    assert inspect.iscoroutinefunction(ai.generate_taskspec)
+    assert ai.generate_taskspec.__code__.co_argcount == 2
+    assert list(inspect.signature(ai.generate_taskspec).parameters) == ["prompt", "model"]
+
+
+def test_strip_fences_handles_closed_and_truncated_blocks() -> None:
+    from axiom_server.ai import _strip_fences
+
+    assert _strip_fences("```yaml\na: 1\nb: 2\n```\n") == "a: 1\nb: 2"
+    assert _strip_fences("```yaml\na: 1\n") == "a: 1"
+    assert _strip_fences("  a: 1  \n") == "a: 1"
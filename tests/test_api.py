@@ -2,29 +2,25 @@
 
 from __future__ import annotations
 
-import json
+import gzip
 import os
-import tempfile
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
+import orjson
 import pytest
+import yaml
 from fastapi.testclient import TestClient
 
-# Point data dir to a temp location before importing the app.
-_tmpdir = tempfile.mkdtemp()
-os.environ.setdefault("AXIOM_DATA_DIR", _tmpdir)
+import axiom_server.app as app_module
 
-import axiom_server.app as app_module  # noqa: E402
 
-app_module.DATA_DIR = Path(_tmpdir)
-app_module.RUNS_DIR = Path(_tmpdir) / "runs"
-app_module.SWEEPS_DIR = Path(_tmpdir) / "sweeps"
-app_module.store = app_module.RunStore(Path(_tmpdir) / "axiom.db")
-
-from axiom_server.app import app  # noqa: E402
-
-client = TestClient(app)
+@pytest.fixture(autouse=True)
+def _clear_ai_status_cache() -> None:
+    """AI status is cached briefly; tests patch the env between requests."""
+    app_module.ai.clear_status_cache()
 
 SAMPLE_YAML = """\
 task_id: api-test-001
@@ -87,11 +83,31 @@ allowed_adjustments:
   can_move_target: true
 """
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SAMPLE_DICT = yaml.load(SAMPLE_YAML, Loader=_YamlLoader)
+
+
+def _post_yaml(client: TestClient, body: str) -> dict:
+    resp = client.post("/runs", content=body, headers={"Content-Type": "text/plain"})
+    assert resp.status_code == 200
+    return resp.json()
+
+
+# Runs are deterministic, so read-only tests share one POST per input.
+@pytest.fixture(scope="module")
+def sample_run(client: TestClient) -> dict:
+    return _post_yaml(client, SAMPLE_YAML)
+
+
+@pytest.fixture(scope="module")
+def failing_run(client: TestClient) -> dict:
+    return _post_yaml(client, FAILING_YAML)
+
 
 # ── health ────────────────────────────────────────────────────────────────
 
 
-def test_health() -> None:
+def test_health(client: TestClient) -> None:
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
@@ -100,40 +116,48 @@ def test_health() -> None:
 # ── POST /runs ────────────────────────────────────────────────────────────
 
 
-def test_post_run_yaml() -> None:
-    resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
-    assert resp.status_code == 200
-    data = resp.json()
+def test_post_run_yaml(sample_run: dict) -> None:
+    data = sample_run
     assert data["verdict"] == "CAN"
     assert data["run_id"]
     assert data["evidence_url"].startswith("/runs/")
 
-    # Evidence file must exist on disk.
-    evidence_path = app_module.RUNS_DIR / data["run_id"] / "evidence.json"
-    assert evidence_path.exists()
-    evidence = json.loads(evidence_path.read_text())
+    # Evidence is stored with the run ...
+    blob = app_module.store.get_evidence_blob(data["run_id"])
+    evidence = orjson.loads(gzip.decompress(blob))
     assert evidence["verdict"] == "CAN"
 
+    # ... and still written to disk for tools that read the files.
+    run_dir = app_module.RUNS_DIR / data["run_id"]
+    assert orjson.loads((run_dir / "evidence.json").read_bytes()) == evidence
+    assert [p.name for p in run_dir.iterdir()] == ["evidence.json"]
+
 
-def test_post_run_json() -> None:
-    import yaml as _yaml
+def test_post_run_skips_evidence_file_when_disabled(client: TestClient) -> None:
+    with patch.dict(os.environ, {"AXIOM_EVIDENCE_FILES": "0"}):
+        resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
+    data = resp.json()
 
-    raw = _yaml.safe_load(SAMPLE_YAML)
-    resp = client.post("/runs", json=raw)
+    assert not (app_module.RUNS_DIR / data["run_id"]).exists()
+    resp = client.get(data["evidence_url"])
     assert resp.status_code == 200
     assert resp.json()["verdict"] == "CAN"
 
 
-def test_post_run_failing() -> None:
-    resp = client.post("/runs", content=FAILING_YAML, headers={"Content-Type": "text/plain"})
+def test_post_run_json(client: TestClient) -> None:
+    resp = client.post("/runs", json=_SAMPLE_DICT)
     assert resp.status_code == 200
-    data = resp.json()
+    assert resp.json()["verdict"] == "CAN"
+
+
+def test_post_run_failing(failing_run: dict) -> None:
+    data = failing_run
     assert data["verdict"] == "HARD_CANT"
     assert data["failed_gate"] == "keepout"
     assert data["top_fix"] == "MOVE_TARGET"
 
 
-def test_post_run_invalid_yaml() -> None:
+def test_post_run_invalid_yaml(client: TestClient) -> None:
     resp = client.post("/runs", content="meta: 123", headers={"Content-Type": "text/plain"})
     assert resp.status_code == 422
 
@@ -141,9 +165,7 @@ def test_post_run_invalid_yaml() -> None:
 # ── GET /runs ─────────────────────────────────────────────────────────────
 
 
-def test_list_runs_returns_posted() -> None:
-    # Post one run first.
-    client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
+def test_list_runs_returns_posted(client: TestClient, sample_run: dict) -> None:
     resp = client.get("/runs")
     assert resp.status_code == 200
     runs = resp.json()
@@ -154,15 +176,14 @@ def test_list_runs_returns_posted() -> None:
 # ── GET /runs/{run_id} ───────────────────────────────────────────────────
 
 
-def test_get_run_detail() -> None:
-    post_resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
-    run_id = post_resp.json()["run_id"]
+def test_get_run_detail(client: TestClient, sample_run: dict) -> None:
+    run_id = sample_run["run_id"]
     resp = client.get(f"/runs/{run_id}")
     assert resp.status_code == 200
     assert resp.json()["run_id"] == run_id
 
 
-def test_get_run_not_found() -> None:
+def test_get_run_not_found(client: TestClient) -> None:
     resp = client.get("/runs/nonexistent")
     assert resp.status_code == 404
 
@@ -170,9 +191,8 @@ def test_get_run_not_found() -> None:
 # ── GET /runs/{run_id}/evidence ──────────────────────────────────────────
 
 
-def test_get_evidence() -> None:
-    post_resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
-    run_id = post_resp.json()["run_id"]
+def test_get_evidence(client: TestClient, sample_run: dict) -> None:
+    run_id = sample_run["run_id"]
     resp = client.get(f"/runs/{run_id}/evidence")
     assert resp.status_code == 200
     evidence = resp.json()
@@ -180,7 +200,44 @@ def test_get_evidence() -> None:
     assert "checks" in evidence
 
 
-def test_get_evidence_not_found() -> None:
+def test_get_evidence_etag_not_modified(client: TestClient, sample_run: dict) -> None:
+    run_id = sample_run["run_id"]
+    first = client.get(f"/runs/{run_id}/evidence")
+    etag = first.headers["etag"]
+    assert etag
+    again = client.get(f"/runs/{run_id}/evidence", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert first.headers["vary"] == again.headers["vary"] == "Accept-Encoding"
+
+
+def test_get_evidence_serves_precompressed_gzip(client: TestClient, sample_run: dict) -> None:
+    run_id = sample_run["run_id"]
+    gz = client.get(f"/runs/{run_id}/evidence", headers={"Accept-Encoding": "gzip"})
+    assert gz.status_code == 200
+    assert gz.headers["content-encoding"] == "gzip"
+    plain = client.get(f"/runs/{run_id}/evidence", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert gz.json() == plain.json()
+
+
+def test_get_evidence_honours_gzip_q_values(client: TestClient, sample_run: dict) -> None:
+    run_id = sample_run["run_id"]
+    for accept, gzipped in [
+        ("gzip;q=0", False),
+        ("br, gzip; q=0.0", False),
+        ("*;q=0", False),
+        ("gzip;q=0.5, identity", True),
+        ("*", True),
+        ("*, gzip;q=0", False),
+    ]:
+        resp = client.get(f"/runs/{run_id}/evidence", headers={"Accept-Encoding": accept})
+        assert resp.status_code == 200
+        assert (resp.headers.get("content-encoding") == "gzip") is gzipped, accept
+        assert resp.json()["verdict"] == "CAN"
+
+
+def test_get_evidence_not_found(client: TestClient) -> None:
     resp = client.get("/runs/nonexistent/evidence")
     assert resp.status_code == 404
 
@@ -188,7 +245,7 @@ def test_get_evidence_not_found() -> None:
 # ── GET / (web UI) ───────────────────────────────────────────────────────
 
 
-def test_index_page() -> None:
+def test_index_page(client: TestClient) -> None:
     resp = client.get("/")
     assert resp.status_code == 200
     assert "axiom-tfg" in resp.text
@@ -198,7 +255,7 @@ def test_index_page() -> None:
 # ── GET /examples ────────────────────────────────────────────────────────
 
 
-def test_list_examples() -> None:
+def test_list_examples(client: TestClient) -> None:
     resp = client.get("/examples")
     assert resp.status_code == 200
     names = resp.json()
@@ -208,7 +265,7 @@ def test_list_examples() -> None:
     assert len(names) >= 4
 
 
-def test_get_example_yaml() -> None:
+def test_get_example_yaml(client: TestClient) -> None:
     resp = client.get("/examples/pick_place_can.yaml")
     assert resp.status_code == 200
     assert resp.headers["content-type"].startswith("text/plain")
@@ -216,12 +273,12 @@ def test_get_example_yaml() -> None:
     assert "pick_and_place" in resp.text
 
 
-def test_get_example_not_found() -> None:
+def test_get_example_not_found(client: TestClient) -> None:
     resp = client.get("/examples/nonexistent.yaml")
     assert resp.status_code == 404
 
 
-def test_get_example_path_traversal() -> None:
+def test_get_example_path_traversal(client: TestClient) -> None:
     resp = client.get("/examples/..%2Fpyproject.toml")
     assert resp.status_code in (400, 404)
 
@@ -229,20 +286,16 @@ def test_get_example_path_traversal() -> None:
 # ── POST /runs returns top_fix_patch ─────────────────────────────────────
 
 
-def test_post_run_returns_top_fix_patch() -> None:
-    resp = client.post("/runs", content=FAILING_YAML, headers={"Content-Type": "text/plain"})
-    assert resp.status_code == 200
-    data = resp.json()
+def test_post_run_returns_top_fix_patch(failing_run: dict) -> None:
+    data = failing_run
     assert data["verdict"] == "HARD_CANT"
     assert data["top_fix_patch"] is not None
     assert data["top_fix_patch"]["kind"] == "MOVE_TARGET"
     assert len(data["top_fix_patch"]["new_xyz"]) == 3
 
 
-def test_post_run_can_has_null_fix_patch() -> None:
-    resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
-    assert resp.status_code == 200
-    data = resp.json()
+def test_post_run_can_has_null_fix_patch(sample_run: dict) -> None:
+    data = sample_run
     assert data["verdict"] == "CAN"
     assert data["top_fix_patch"] is None
 
@@ -250,13 +303,11 @@ def test_post_run_can_has_null_fix_patch() -> None:
 # ── AXIOM_PUBLIC_BASE_URL ─────────────────────────────────────────────────
 
 
-def test_evidence_url_relative_by_default() -> None:
-    resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
-    assert resp.status_code == 200
-    assert resp.json()["evidence_url"].startswith("/runs/")
+def test_evidence_url_relative_by_default(sample_run: dict) -> None:
+    assert sample_run["evidence_url"].startswith("/runs/")
 
 
-def test_evidence_url_absolute_with_base_url() -> None:
+def test_evidence_url_absolute_with_base_url(client: TestClient) -> None:
     with patch.object(app_module, "PUBLIC_BASE_URL", "https://axiom.example.com"):
         resp = client.post("/runs", content=SAMPLE_YAML, headers={"Content-Type": "text/plain"})
     assert resp.status_code == 200
@@ -267,11 +318,9 @@ def test_evidence_url_absolute_with_base_url() -> None:
 # ── GET /ai/status ────────────────────────────────────────────────────────
 
 
-def test_ai_status_disabled_without_key() -> None:
-    env = os.environ.copy()
-    env.pop("GOOGLE_API_KEY", None)
-    with patch.dict(os.environ, env, clear=True):
-        resp = client.get("/ai/status")
+def test_ai_status_disabled_without_key(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    resp = client.get("/ai/status")
     assert resp.status_code == 200
     data = resp.json()
     assert data["ai_enabled"] is False
@@ -279,7 +328,7 @@ def test_ai_status_disabled_without_key() -> None:
 
 
 @patch.dict(os.environ, {"GOOGLE_API_KEY": "fake-key"})
-def test_ai_status_enabled_with_key() -> None:
+def test_ai_status_enabled_with_key(client: TestClient) -> None:
     resp = client.get("/ai/status")
     assert resp.status_code == 200
     data = resp.json()
@@ -306,7 +355,7 @@ _SWEEP_PAYLOAD = {
 }
 
 
-def test_post_sweeps_returns_deterministic_summary() -> None:
+def test_post_sweeps_returns_deterministic_summary(client: TestClient) -> None:
     """Run the same sweep twice — summary and first 3 verdicts must match."""
     resp1 = client.post("/sweeps", json=_SWEEP_PAYLOAD)
     assert resp1.status_code == 200
@@ -330,7 +379,7 @@ def test_post_sweeps_returns_deterministic_summary() -> None:
         assert data1["runs"][i]["failed_gate"] == data2["runs"][i]["failed_gate"]
 
 
-def test_post_sweeps_respects_bounds() -> None:
+def test_post_sweeps_respects_bounds(client: TestClient) -> None:
     """Tight bounds — sampled values must stay within range."""
     payload = {
         "base_yaml": _SWEEP_BASE,
@@ -358,7 +407,129 @@ def test_post_sweeps_respects_bounds() -> None:
                 assert 1.0 <= mv["mass_kg"] <= 1.5
 
 
-def test_get_sweep_returns_saved_json() -> None:
+def test_run_store_uses_wal_by_default() -> None:
+    mode = app_module.store._reader().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_run_store_migrates_legacy_schema(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE runs (run_id TEXT PRIMARY KEY, task_id TEXT NOT NULL, "
+        "created_at TEXT NOT NULL, verdict TEXT NOT NULL, failed_gate TEXT, "
+        "top_fix TEXT, evidence_path TEXT NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO runs VALUES ('old', 't', '2024-01-01', 'CAN', NULL, NULL, '/x/evidence.json')"
+    )
+    conn.commit()
+    conn.close()
+
+    store = app_module.RunStore(db_path)
+    assert store.get("old")["evidence_path"] == "/x/evidence.json"
+    assert store.get_evidence_blob("old") is None
+    store.insert(
+        run_id="new", task_id="t", created_at="2024-01-02", verdict="CAN",
+        failed_gate=None, top_fix=None, evidence_path=None, evidence_blob=b"{}",
+    )
+    assert store.get_evidence_blob("new") == b"{}"
+
+
+def test_run_store_reads_from_worker_threads(tmp_path: Path) -> None:
+    store = app_module.RunStore(tmp_path / "threads.db")
+    store.insert_many(
+        {
+            "run_id": f"r{i}", "task_id": "t", "created_at": f"2024-01-{i + 1:02d}",
+            "verdict": "CAN", "failed_gate": None, "top_fix": None,
+            "evidence_path": None, "evidence_blob": None,
+        }
+        for i in range(4)
+    )
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        rows = list(pool.map(store.get, [f"r{i}" for i in range(4)]))
+    assert [r["run_id"] for r in rows] == ["r0", "r1", "r2", "r3"]
+
+
+def test_list_recent_uses_created_at_index() -> None:
+    plan = app_module.store._reader().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM runs ORDER BY created_at DESC LIMIT 50"
+    ).fetchall()
+    assert any("idx_runs_created_at" in row[-1] for row in plan)
+
+
+def test_post_sweeps_records_every_run(client: TestClient) -> None:
+    """Sweep runs are stored in one batch and each is retrievable."""
+    resp = client.post("/sweeps", json=_SWEEP_PAYLOAD)
+    assert resp.status_code == 200
+    for run in resp.json()["runs"]:
+        detail = client.get(f"/runs/{run['run_id']}")
+        assert detail.status_code == 200
+        assert detail.json()["verdict"] == run["verdict"]
+
+
+def test_post_sweeps_process_pool_matches_in_process(client: TestClient) -> None:
+    """Spreading variants across worker processes must not change results."""
+    with patch.dict(os.environ, {"AXIOM_SWEEP_WORKERS": "1"}):
+        serial = client.post("/sweeps", json=_SWEEP_PAYLOAD).json()
+    try:
+        with patch.dict(os.environ, {"AXIOM_SWEEP_WORKERS": "2"}):
+            pooled = client.post("/sweeps", json=_SWEEP_PAYLOAD).json()
+    finally:
+        app_module.shutdown_gate_pool()
+
+    assert pooled["summary"] == serial["summary"]
+    assert [r["verdict"] for r in pooled["runs"]] == [r["verdict"] for r in serial["runs"]]
+
+
+def test_gate_pool_is_shared_and_follows_worker_count() -> None:
+    from axiom_server import sweep
+
+    try:
+        with patch.dict(os.environ, {"AXIOM_SWEEP_WORKERS": "2"}):
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                pools = list(ex.map(lambda _: sweep._get_gate_pool(), range(8)))
+            assert len({id(pool) for pool, _ in pools}) == 1
+            assert pools[0][1] == 2
+        with patch.dict(os.environ, {"AXIOM_SWEEP_WORKERS": "3"}):
+            pool, workers = sweep._get_gate_pool()
+            assert pool is not pools[0][0]
+            assert workers == 3
+        assert sweep._get_gate_pool() == (None, 1)
+    finally:
+        app_module.shutdown_gate_pool()
+
+
+def test_post_sweeps_rejects_invalid_mass_range(client: TestClient) -> None:
+    payload = {
+        "base_yaml": _SWEEP_BASE,
+        "variations": {"mass_kg": {"min": -2.0, "max": -1.0}},
+        "n": 3,
+    }
+    resp = client.post("/sweeps", json=payload)
+    assert resp.status_code == 422
+
+
+def test_post_sweeps_accepts_mass_range_from_zero(client: TestClient) -> None:
+    # Only sampled masses are validated; samples practically never hit 0.
+    payload = {
+        "base_yaml": _SWEEP_BASE,
+        "variations": {"mass_kg": {"min": 0.0, "max": 1.0}},
+        "n": 3,
+    }
+    resp = client.post("/sweeps", json=payload)
+    assert resp.status_code == 200
+    assert len(resp.json()["runs"]) == 3
+
+
+def test_post_sweeps_rejects_malformed_json(client: TestClient) -> None:
+    resp = client.post(
+        "/sweeps", content=b"{not json", headers={"content-type": "application/json"}
+    )
+    assert resp.status_code == 400
+
+
+def test_get_sweep_returns_saved_json(client: TestClient) -> None:
     """POST /sweeps then GET /sweeps/{id} returns 200 with run_ids."""
     resp = client.post("/sweeps", json=_SWEEP_PAYLOAD)
     assert resp.status_code == 200
@@ -372,6 +543,6 @@ def test_get_sweep_returns_saved_json() -> None:
     assert "summary" in data
 
 
-def test_get_sweep_not_found() -> None:
+def test_get_sweep_not_found(client: TestClient) -> None:
     resp = client.get("/sweeps/nonexistent")
     assert resp.status_code == 404
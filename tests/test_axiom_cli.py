@@ -245,6 +245,38 @@ class TestSweep:
         )
         assert result.exit_code == 2
 
+    def test_sweep_accepts_zero_mass_min(self, tmp_path: Path) -> None:
+        out = tmp_path / "sweep_out"
+        result = runner.invoke(
+            app,
+            [
+                "sweep",
+                str(EXAMPLES / "pick_place_can.yaml"),
+                "--n", "5",
+                "--seed", "1",
+                "--mass-min", "0",
+                "--mass-max", "0.5",
+                "--out", str(out),
+            ],
+        )
+        assert result.exit_code == 0
+        assert (out / "sweep.csv").exists()
+
+    def test_sweep_invalid_mass_range_exits_1(self, tmp_path: Path) -> None:
+        result = runner.invoke(
+            app,
+            [
+                "sweep",
+                str(EXAMPLES / "pick_place_can.yaml"),
+                "--n", "5",
+                "--mass-min", "-2",
+                "--mass-max", "-1",
+                "--out", str(tmp_path / "sweep_out"),
+            ],
+        )
+        assert result.exit_code == 1
+        assert not (tmp_path / "sweep_out").exists()
+
     def test_sweep_no_junit_flag(self, tmp_path: Path) -> None:
         out = tmp_path / "sweep_out"
         runner.invoke(
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+import orjson
+import pytest
+from click.testing import Result
 from typer.testing import CliRunner
 
 from axiom_tfg.cli import app
@@ -14,14 +16,30 @@ runner = CliRunner()
 EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
 
 
-def test_run_can(tmp_path: Path) -> None:
-    result = runner.invoke(app, ["run", str(EXAMPLES / "pick_place_can.yaml"), "--out", str(tmp_path)])
+# Runs are deterministic, so tests that only inspect the output of the same
+# invocation share it.
+@pytest.fixture(scope="module")
+def can_run(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Result]:
+    out = tmp_path_factory.mktemp("run_can")
+    result = runner.invoke(app, ["run", str(EXAMPLES / "pick_place_can.yaml"), "--out", str(out)])
+    return out, result
+
+
+@pytest.fixture(scope="module")
+def demo_run(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Result]:
+    out = tmp_path_factory.mktemp("demo")
+    result = runner.invoke(app, ["demo", "--out", str(out)])
+    return out, result
+
+
+def test_run_can(can_run: tuple[Path, Result]) -> None:
+    out, result = can_run
     assert result.exit_code == 0
     assert "CAN" in result.output
 
-    evidence = tmp_path / "pick-place-001" / "evidence.json"
+    evidence = out / "pick-place-001" / "evidence.json"
     assert evidence.exists()
-    data = json.loads(evidence.read_text())
+    data = orjson.loads(evidence.read_bytes())
     assert data["verdict"] == "CAN"
     assert data["failed_gate"] is None
     assert len(data["checks"]) >= 3  # all gates ran
@@ -34,7 +52,7 @@ def test_run_cant_reach(tmp_path: Path) -> None:
     assert "OUT_OF_REACH" in result.output
 
     evidence = tmp_path / "pick-place-002-reach" / "evidence.json"
-    data = json.loads(evidence.read_text())
+    data = orjson.loads(evidence.read_bytes())
     assert data["verdict"] == "HARD_CANT"
     assert data["failed_gate"] == "reachability"
     # Only one gate ran (short-circuit)
@@ -49,7 +67,7 @@ def test_run_cant_payload(tmp_path: Path) -> None:
     assert "OVER_PAYLOAD" in result.output
 
     evidence = tmp_path / "pick-place-003-payload" / "evidence.json"
-    data = json.loads(evidence.read_text())
+    data = orjson.loads(evidence.read_bytes())
     assert data["verdict"] == "HARD_CANT"
     assert data["failed_gate"] == "payload"
     splits = [f for f in data["counterfactual_fixes"] if f["type"] == "SPLIT_PAYLOAD"]
@@ -71,10 +89,10 @@ def test_validate_bad_yaml(tmp_path: Path) -> None:
     assert "Validation errors" in result.output
 
 
-def test_evidence_has_timestamps(tmp_path: Path) -> None:
-    runner.invoke(app, ["run", str(EXAMPLES / "pick_place_can.yaml"), "--out", str(tmp_path)])
-    evidence = tmp_path / "pick-place-001" / "evidence.json"
-    data = json.loads(evidence.read_text())
+def test_evidence_has_timestamps(can_run: tuple[Path, Result]) -> None:
+    out, _ = can_run
+    evidence = out / "pick-place-001" / "evidence.json"
+    data = orjson.loads(evidence.read_bytes())
     assert "created_at" in data
     assert "axiom_tfg_version" in data
 
@@ -82,21 +100,21 @@ def test_evidence_has_timestamps(tmp_path: Path) -> None:
 # ── demo command ───────────────────────────────────────────────────────────
 
 
-def test_demo_exit_code(tmp_path: Path) -> None:
-    result = runner.invoke(app, ["demo", "--out", str(tmp_path)])
+def test_demo_exit_code(demo_run: tuple[Path, Result]) -> None:
+    _, result = demo_run
     assert result.exit_code == 0
 
 
-def test_demo_writes_all_evidence(tmp_path: Path) -> None:
-    runner.invoke(app, ["demo", "--out", str(tmp_path)])
-    assert (tmp_path / "pick-place-001" / "evidence.json").exists()
-    assert (tmp_path / "pick-place-002-reach" / "evidence.json").exists()
-    assert (tmp_path / "pick-place-003-payload" / "evidence.json").exists()
-    assert (tmp_path / "pick-place-004-keepout" / "evidence.json").exists()
+def test_demo_writes_all_evidence(demo_run: tuple[Path, Result]) -> None:
+    out, _ = demo_run
+    assert (out / "pick-place-001" / "evidence.json").exists()
+    assert (out / "pick-place-002-reach" / "evidence.json").exists()
+    assert (out / "pick-place-003-payload" / "evidence.json").exists()
+    assert (out / "pick-place-004-keepout" / "evidence.json").exists()
 
 
-def test_demo_output_contains_verdicts(tmp_path: Path) -> None:
-    result = runner.invoke(app, ["demo", "--out", str(tmp_path)])
+def test_demo_output_contains_verdicts(demo_run: tuple[Path, Result]) -> None:
+    _, result = demo_run
     assert "CAN" in result.output
     assert "HARD_CANT" in result.output
     # All example filenames appear in the table
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import math
 
+from axiom_tfg.evidence import run_gates
 from axiom_tfg.gates.keepout import check_keepout
 from axiom_tfg.models import (
     AllowedAdjustments,
@@ -131,7 +132,7 @@ def test_fix_moves_outside_by_at_least_buffer() -> None:
     assert outside, f"Escaped point {escaped} is still inside expanded AABB"
 
     # Delta must equal the L2 distance of the move.
-    dist = math.sqrt(sum((a - b) ** 2 for a, b in zip([2.0, 2.0, 2.0], escaped)))
+    dist = math.dist([2.0, 2.0, 2.0], escaped)
     assert abs(fix.delta - dist) < 1e-6
 
 
@@ -150,6 +151,26 @@ def test_fix_chooses_nearest_face() -> None:
     assert abs(fix.proposed_patch["projected_target_xyz"][0] - 3.05) < 1e-6
 
 
+def test_fix_clears_float_inexact_face() -> None:
+    """max 0.8 + buffer 0.05 is 0.8500000000000001; the patched target must
+    land on that face, not on a rounded 0.85 that is still inside."""
+    zone = KeepoutZone(id="bin", min_xyz=[0.0, 0.0, 0.0], max_xyz=[0.8, 1.0, 1.0])
+    spec = _make_spec(
+        target=[0.79, 0.5, 0.5],
+        zones=[zone],
+        safety_buffer=0.05,
+        can_move_target=True,
+    )
+    _, fixes = check_keepout(spec)
+    patched = fixes[0].proposed_patch["projected_target_xyz"]
+    assert patched[0] == 0.8 + 0.05
+
+    result, _ = check_keepout(
+        _make_spec(target=patched, zones=[zone], safety_buffer=0.05)
+    )
+    assert result.status == GateStatus.PASS
+
+
 def test_no_fix_when_adjustment_disallowed() -> None:
     spec = _make_spec(
         target=[2.0, 2.0, 2.0],
@@ -161,13 +182,35 @@ def test_no_fix_when_adjustment_disallowed() -> None:
     assert fixes == []
 
 
+def test_many_zones_reports_first_violator() -> None:
+    """With enough zones to take the vectorised path, the first overlapping
+    zone in declaration order is still the one reported."""
+    far = [
+        KeepoutZone(id=f"far-{i}", min_xyz=[10.0 + i, 10.0, 10.0], max_xyz=[10.5 + i, 10.5, 10.5])
+        for i in range(8)
+    ]
+    zones = far + [ZONE, KeepoutZone(id="box2", min_xyz=[0.0, 0.0, 0.0], max_xyz=[5.0, 5.0, 5.0])]
+    spec = _make_spec(target=[2.0, 2.0, 2.0], zones=zones)
+    result, _ = check_keepout(spec)
+    assert result.status == GateStatus.FAIL
+    assert result.measured_values["violating_zone_id"] == "box"
+
+
+def test_many_zones_boundary_is_outside() -> None:
+    zones = [
+        KeepoutZone(id=f"z-{i}", min_xyz=[1.0, 1.0, 1.0 + 3 * i], max_xyz=[3.0, 3.0, 3.0 + 3 * i])
+        for i in range(8)
+    ]
+    spec = _make_spec(target=[3.0, 2.0, 2.0], zones=zones, safety_buffer=0.0)
+    result, _ = check_keepout(spec)
+    assert result.status == GateStatus.PASS
+
+
 # ── pipeline short-circuit behaviour ──────────────────────────────────────
 
 
 def test_reachability_fail_skips_keepout() -> None:
     """When reachability fails, keepout should never be evaluated."""
-    from axiom_tfg.evidence import run_gates
-
     spec = TaskSpec(
         task_id="test-sc-reach",
         meta=MetaSpec(template="pick_and_place"),
@@ -195,8 +238,6 @@ def test_reachability_fail_skips_keepout() -> None:
 
 def test_payload_fail_skips_keepout() -> None:
     """When payload fails, keepout should never be evaluated."""
-    from axiom_tfg.evidence import run_gates
-
     spec = TaskSpec(
         task_id="test-sc-payload",
         meta=MetaSpec(template="pick_and_place"),
@@ -189,6 +189,24 @@ def test_no_fix_when_adjustment_disallowed() -> None:
     assert fixes == []
 
 
+def test_distant_zones_do_not_mask_crossing() -> None:
+    """Zones away from the path are pruned; the crossed zone is still found."""
+    far = [
+        KeepoutZone(id=f"far-{i}", min_xyz=[5.0 + i, 5.0, 0.0], max_xyz=[5.5 + i, 5.5, 1.0])
+        for i in range(5)
+    ]
+    spec = _make_spec(
+        initial=[0.0, 0.0, 0.5],
+        target=[1.0, 1.0, 0.5],
+        zones=far + [ZONE],
+    )
+    result_tuple = check_path_keepout(spec)
+    assert result_tuple is not None
+    result, _ = result_tuple
+    assert result.status == GateStatus.FAIL
+    assert result.measured_values["violating_zone_id"] == "safety_cage"
+
+
 # ── pipeline integration ────────────────────────────────────────────────
 
 
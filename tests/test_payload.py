@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from axiom_tfg.gates.payload import check_payload
+from axiom_tfg.columnar import TaskSpecColumnar
+from axiom_tfg.gates.payload import check_payload, check_payload_batch
 from axiom_tfg.models import (
     AllowedAdjustments,
     ConstructorSpec,
@@ -97,3 +98,29 @@ def test_over_payload_both_fixes() -> None:
     assert fixes[0].type == FixType.SPLIT_PAYLOAD
     assert fixes[0].proposed_patch["suggested_payload_split_count"] == 5
     assert fixes[1].type == FixType.CHANGE_CONSTRUCTOR
+
+
+def test_batch_matches_single_spec_checks() -> None:
+    specs = [
+        _make_spec(mass_kg=2.0, max_payload_kg=5.0),
+        _make_spec(mass_kg=5.0, max_payload_kg=5.0),
+        _make_spec(mass_kg=12.0, max_payload_kg=5.0, can_split_payload=True),
+    ]
+    batch = check_payload_batch(TaskSpecColumnar.from_specs(specs))
+    for spec, (result, fixes) in zip(specs, batch):
+        expected_result, expected_fixes = check_payload(spec)
+        assert result.model_dump() == expected_result.model_dump()
+        assert [f.model_dump() for f in fixes] == [f.model_dump() for f in expected_fixes]
+
+
+def test_split_count_edge_cases() -> None:
+    # Decimal multiples must not round up to an extra lift.
+    for mass, max_payload, expected in [
+        (50.5, 10.1, 5),
+        (8.34, 2.78, 3),
+        (5.0001, 5.0, 2),
+        (1000.0, 0.1, 10000),
+    ]:
+        spec = _make_spec(mass_kg=mass, max_payload_kg=max_payload, can_split_payload=True)
+        _, fixes = check_payload(spec)
+        assert fixes[0].proposed_patch["suggested_payload_split_count"] == expected
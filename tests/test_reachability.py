@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import math
 
-from axiom_tfg.gates.reachability import check_reachability
+from axiom_tfg.columnar import TaskSpecColumnar
+from axiom_tfg.evidence import run_gates, run_gates_batch
+from axiom_tfg.gates.reachability import check_reachability, check_reachability_batch
 from axiom_tfg.models import (
     AllowedAdjustments,
     ConstructorSpec,
@@ -64,6 +66,25 @@ def test_exactly_at_boundary_passes() -> None:
     assert fixes == []
 
 
+# Targets exactly max_reach_m away on common decimal grids.  Squaring both
+# sides rounds differently here (0.8**2 + 1.5**2 > 1.7**2 in floats), so the
+# gate must compare the distance itself.
+_DECIMAL_BOUNDARY_CASES = [
+    ([0.0, 0.8, 1.5], 1.7),
+    ([0.2, 0.3, 0.6], 0.7),
+    ([0.4, 0.6, 1.2], 1.4),
+]
+
+
+def test_decimal_grid_boundary_targets_pass() -> None:
+    for target, max_reach in _DECIMAL_BOUNDARY_CASES:
+        spec = _make_spec(base=[0, 0, 0], target=target, max_reach=max_reach)
+        result, fixes = check_reachability(spec)
+        assert result.status == GateStatus.PASS, target
+        assert result.measured_values["distance_m"] == max_reach
+        assert fixes == []
+
+
 def test_unreachable_fails() -> None:
     spec = _make_spec(base=[0, 0, 0], target=[3, 4, 0], max_reach=1.0)
     result, fixes = check_reachability(spec)
@@ -88,7 +109,7 @@ def test_unreachable_move_target_fix() -> None:
     assert fix.delta == 4.0  # 5.0 - 1.0
 
     projected = fix.proposed_patch["projected_target_xyz"]
-    dist_from_base = math.sqrt(sum(v**2 for v in projected))
+    dist_from_base = math.hypot(*projected)
     assert abs(dist_from_base - 1.0) < 1e-6
 
 
@@ -126,3 +147,60 @@ def test_unreachable_multiple_fixes() -> None:
         FixType.MOVE_BASE,
         FixType.CHANGE_CONSTRUCTOR,
     ]
+
+
+def test_batch_matches_single_spec_checks() -> None:
+    specs = [
+        _make_spec(base=[0, 0, 0], target=[1, 0, 0], max_reach=2.0),
+        _make_spec(base=[0, 0, 0], target=[3, 4, 0], max_reach=2.0, can_move_target=True),
+        _make_spec(base=[1, 1, 0], target=[1, 1, 2], max_reach=2.0),
+        _make_spec(base=[0, 0, 0], target=[0, 0, 9], max_reach=1.5, can_move_base=True),
+    ]
+    batch = check_reachability_batch(TaskSpecColumnar.from_specs(specs))
+    assert len(batch) == len(specs)
+    for spec, (result, fixes) in zip(specs, batch):
+        expected_result, expected_fixes = check_reachability(spec)
+        assert result.model_dump() == expected_result.model_dump()
+        assert [f.model_dump() for f in fixes] == [f.model_dump() for f in expected_fixes]
+
+
+def test_copied_constructor_uses_updated_reach() -> None:
+    spec = _make_spec(base=[0, 0, 0], target=[0, 0, 2.5], max_reach=2.0)
+    constructor = spec.constructor.model_copy(update={"max_reach_m": 3.0})
+    spec = spec.model_copy(update={"constructor": constructor})
+
+    result, _ = check_reachability(spec)
+    assert result.status == GateStatus.PASS
+    [(batch_result, _)] = check_reachability_batch(TaskSpecColumnar.from_specs([spec]))
+    assert batch_result.status == GateStatus.PASS
+
+
+def test_run_gates_batch_matches_run_gates_on_decimal_boundaries() -> None:
+    specs = [
+        _make_spec(base=[0, 0, 0], target=target, max_reach=max_reach, can_move_target=True)
+        for target, max_reach in _DECIMAL_BOUNDARY_CASES
+    ]
+    specs.append(_make_spec(base=[0, 0, 0], target=[0.0, 0.8, 1.5], max_reach=1.6999999))
+    packets = run_gates_batch(specs)
+    for spec, packet in zip(specs, packets):
+        expected = run_gates(spec, created_at=packet.created_at)
+        assert packet.model_dump() == expected.model_dump()
+    assert [p.verdict for p in packets] == ["CAN", "CAN", "CAN", "HARD_CANT"]
+
+
+def test_batch_empty() -> None:
+    assert check_reachability_batch(TaskSpecColumnar.from_specs([])) == []
+
+
+def test_run_gates_batch_shares_created_at() -> None:
+    from datetime import datetime
+
+    specs = [
+        _make_spec(base=[0, 0, 0], target=[1, 0, 0], max_reach=2.0),
+        _make_spec(base=[0, 0, 0], target=[3, 4, 0], max_reach=2.0),
+    ]
+    packets = run_gates_batch(specs)
+    assert packets[0].created_at == packets[1].created_at
+    # Millisecond precision: "...T12:34:56.789+00:00".
+    assert len(packets[0].created_at.split(".")[1]) == len("789+00:00")
+    datetime.fromisoformat(packets[0].created_at)